@@ -0,0 +1,4 @@
+"""Performance tooling for the Advent of Code 2025 solutions.
+
+Modules are run from the repository root, e.g. ``python -m tools.day01.vectorized``.
+"""
@@ -0,0 +1,69 @@
+"""Helpers shared by the tools in this package."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INPUTS_DIR = REPO_ROOT / "inputs"
+
+
+def input_path(day: str) -> Path:
+    """Return the puzzle input for a two-digit day, e.g. ``input_path("01")``."""
+    return INPUTS_DIR / f"{day}.txt"
+
+
+def load_solution(relative_path: str) -> ModuleType:
+    """Import a solution file by path, e.g. ``"ai-solutions/01/opus-4.5/python/solution.py"``.
+
+    Only solutions guarded by ``if __name__ == "__main__"`` can be imported
+    without running them.
+    """
+    path = REPO_ROOT / relative_path
+    name = "_solution_" + "_".join(path.relative_to(REPO_ROOT).with_suffix("").parts).replace("-", "_").replace(".", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_time(fn: Callable[[], object], repeat: int = 5, warmup: int = 1) -> float:
+    """Best wall time in seconds of ``fn()`` over ``repeat`` runs after ``warmup`` runs."""
+    for _ in range(warmup):
+        fn()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def line_aligned_shards(path: Path, count: int) -> list[tuple[int, int]]:
+    """Split a file into up to ``count`` ``(start, end)`` byte ranges on line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with path.open("rb") as file:
+        for i in range(1, count):
+            target = size * i // count
+            if target <= bounds[-1]:
+                continue
+            # Back up one byte so a target that already starts a line stays put.
+            file.seek(target - 1)
+            file.readline()
+            offset = file.tell()
+            if bounds[-1] < offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def read_range(path: Path, start: int, end: int) -> bytes:
+    with path.open("rb") as file:
+        file.seek(start)
+        return file.read(end - start)
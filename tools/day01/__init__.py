@@ -0,0 +1 @@
+"""Day 01 (Secret Entrance) dial engines."""
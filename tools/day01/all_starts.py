@@ -0,0 +1,68 @@
+"""Day 01 answers for all 100 start positions in one pass.
+
+The dial is translation invariant: a dial started at ``p`` is on 0 exactly when
+a dial started at 0 is on ``-p``. So one replay from position 0, recording how
+often each of the 100 positions is landed on and clicked through, holds the
+answers for every start; `tools.day01.histogram` computes those counts.
+
+    python -m tools.day01.all_starts [input]
+    python -m tools.day01.all_starts --bench 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from tools.common import best_time, input_path
+from tools.day01 import dial
+from tools.day01.dial import MODULO
+from tools.day01.histogram import visit_counts
+from tools.day01.parser import load_steps, parse_buffer
+from tools.day01.vectorized import solve_array
+
+
+def solve_all_starts(steps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(part1, part2)`` arrays indexed by start position."""
+    landed, clicked = visit_counts(steps, start=0)
+    mirrored = -np.arange(MODULO) % MODULO
+    return landed[mirrored], clicked[mirrored]
+
+
+def benchmark(moves: int, repeat: int) -> None:
+    array = parse_buffer(dial.random_log(moves).encode())
+    part1, part2 = solve_all_starts(array)
+    for start in range(MODULO):
+        if solve_array(array, start) != (part1[start], part2[start]):
+            raise AssertionError(f"start {start}: all-starts answer differs from a single run")
+
+    single = best_time(lambda: solve_array(array), repeat)
+    looped = best_time(lambda: [solve_array(array, start) for start in range(MODULO)], 1, 0)
+    combined = best_time(lambda: solve_all_starts(array), repeat)
+    print(f"moves: {moves:,}")
+    print(f"one start:              {single:.4f} s")
+    print(f"100 starts, one by one: {looped:.4f} s")
+    print(f"100 starts, one pass:   {combined:.4f} s ({combined / single:.1f}x one start)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("01"))
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="compare with 100 separate runs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.repeat)
+        return
+
+    part1, part2 = solve_all_starts(load_steps(args.input))
+    print("start\tpart1\tpart2")
+    for start in range(MODULO):
+        print(f"{start}\t{part1[start]}\t{part2[start]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Batch Day 01 solver for directories of rotation logs.
+
+Files are read by a thread pool (file I/O releases the GIL) and their bytes
+handed to a process pool that parses and solves them. One JSON line per file is
+written to stdout as soon as it is solved; throughput in files per second goes
+to stderr.
+
+    python -m tools.day01.batch logs/
+    python -m tools.day01.batch 'logs/**/*.txt' --workers 8 > results.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator
+
+from tools.day01 import dial
+
+READERS = 8
+# Files read but not yet solved; bounds memory on huge batches.
+IN_FLIGHT = 256
+
+
+def expand(pattern: str) -> list[Path]:
+    """All files under a directory, or the files matching a glob."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(p for p in path.rglob("*") if p.is_file())
+    return sorted(Path(p) for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+
+
+def solve_bytes(data: bytes) -> tuple[int, int]:
+    return dial.solve(dial.parse_steps(data.decode()))
+
+
+def solve_files(paths: list[Path], workers: int | None = None) -> Iterator[dict]:
+    """Yield one result record per file, in completion order."""
+    queue = iter(paths)
+    reads: dict[Future, Path] = {}
+    solves: dict[Future, Path] = {}
+
+    with ThreadPoolExecutor(READERS) as readers, ProcessPoolExecutor(workers) as solvers:
+        while True:
+            for path in queue:
+                reads[readers.submit(path.read_bytes)] = path
+                if len(reads) + len(solves) >= IN_FLIGHT:
+                    break
+            if not reads and not solves:
+                return
+
+            done, _ = wait([*reads, *solves], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in reads:
+                    path = reads.pop(future)
+                    try:
+                        solves[solvers.submit(solve_bytes, future.result())] = path
+                    except OSError as error:
+                        yield {"file": str(path), "error": str(error)}
+                    continue
+
+                path = solves.pop(future)
+                try:
+                    part1, part2 = future.result()
+                except (ValueError, IndexError) as error:
+                    yield {"file": str(path), "error": f"{type(error).__name__}: {error}"}
+                else:
+                    yield {"file": str(path), "part1": part1, "part2": part2}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="directories or glob patterns")
+    parser.add_argument("--workers", type=int, default=None, help="solver processes (default: CPU count)")
+    args = parser.parse_args()
+
+    paths = [path for pattern in args.inputs for path in expand(pattern)]
+    started = time.perf_counter()
+    for record in solve_files(paths, args.workers):
+        print(json.dumps(record), flush=True)
+    elapsed = time.perf_counter() - started
+
+    rate = len(paths) / elapsed if elapsed else 0.0
+    print(f"{len(paths)} files in {elapsed:.2f} s ({rate:,.0f} files/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
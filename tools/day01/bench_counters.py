@@ -0,0 +1,135 @@
+"""Adversarial microbenchmark for the Day 01 zero-click counters.
+
+Times every counter on workloads far from the puzzle input, in-process with
+warmup and repeats, cross-checks their results against the human counter and
+prints a Markdown table (ns per call, or why a cell was skipped).
+
+Counters that walk a rotation click by click (gemini-3-pro, composer-1) are
+inline loops in their solutions; they are reproduced here as functions, and
+skipped on workloads whose click total is out of their reach.
+
+    python -m tools.day01.bench_counters [--moves 2000] [--output table.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import Callable
+
+from tools.common import best_time, load_solution
+from tools.day01.dial import MODULO, START, count_clicks_on_zero
+
+CLICK_BUDGET = 2_000_000
+
+
+def gemini_click_loop(position: int, distance: int, direction: str) -> int:
+    """The click-by-click inner loop of ai-solutions/01/gemini-3-pro."""
+    hits = 0
+    for _ in range(distance):
+        if direction == "R":
+            position = (position + 1) % 100
+        else:
+            position = (position - 1) % 100
+        if position == 0:
+            hits += 1
+    return hits
+
+
+def composer_click_loop(start_pos: int, distance: int, direction: str) -> int:
+    """The part-2 inner loop of ai-solutions/01/composer-1."""
+    hits = 0
+    for i in range(1, distance + 1):
+        if direction == "R":
+            if (start_pos + i) % 100 == 0:
+                hits += 1
+        elif (start_pos - i) % 100 == 0:
+            hits += 1
+    return hits
+
+
+def counters() -> dict[str, tuple[Callable[..., int], bool, bool]]:
+    """Name -> (counter, takes signed steps, walks click by click)."""
+    opus = load_solution("ai-solutions/01/opus-4.5/python/solution.py")
+    codex = load_solution("ai-solutions/01/gpt-5.1-codex/python/main.py")
+    return {
+        "human count_clicks_on_zero": (count_clicks_on_zero, True, False),
+        "opus-4.5 count_zeros_during_rotation": (opus.count_zeros_during_rotation, False, False),
+        "gpt-5.1-codex count_zero_hits": (codex.count_zero_hits, False, False),
+        "gemini-3-pro click loop": (gemini_click_loop, False, True),
+        "composer-1 click loop": (composer_click_loop, False, True),
+    }
+
+
+def workloads(moves: int, seed: int = 2025) -> dict[str, list[int]]:
+    """Named lists of signed steps."""
+    rng = random.Random(seed)
+
+    def sign() -> int:
+        return rng.choice((-1, 1))
+
+    return {
+        "puzzle-like (1..999)": [sign() * rng.randint(1, 999) for _ in range(moves)],
+        "huge (~10^12)": [sign() * rng.randint(10**12, 2 * 10**12) for _ in range(moves)],
+        "big-int (~10^30)": [sign() * rng.randint(10**30, 2 * 10**30) for _ in range(moves)],
+        # The first move brings the dial from START to 0; every later move starts there.
+        "all-zero-start (±100k)": [MODULO // 2] + [sign() * MODULO * rng.randint(1, 9) for _ in range(moves - 1)],
+        "L/R jitter (±1)": [(-1) ** i for i in range(moves)],
+        "exact first-zero hits": [MODULO // 2] + [MODULO] * (moves - 1),
+    }
+
+
+def cases(steps: list[int]) -> list[tuple[int, int]]:
+    """Pair every move with the dial position it starts from."""
+    position = START
+    pairs = []
+    for signed_steps in steps:
+        pairs.append((position, signed_steps))
+        position = (position + signed_steps) % MODULO
+    return pairs
+
+
+def run(moves: int, repeat: int) -> str:
+    named_counters = counters()
+    rows = []
+    for workload, steps in workloads(moves).items():
+        signed_args = cases(steps)
+        split_args = [(position, abs(s), "R" if s > 0 else "L") for position, s in signed_args]
+        expected = [count_clicks_on_zero(*args) for args in signed_args]
+        clicks = sum(abs(s) for s in steps)
+
+        cells = []
+        for counter, signed, per_click in named_counters.values():
+            args = signed_args if signed else split_args
+            if per_click and clicks > CLICK_BUDGET:
+                cells.append("skipped (O(distance))")
+                continue
+            if [counter(*a) for a in args] != expected:
+                cells.append("MISMATCH")
+                continue
+            elapsed = best_time(lambda: [counter(*a) for a in args], repeat)
+            cells.append(f"{elapsed / len(args) * 1e9:,.0f}")
+        rows.append((workload, cells))
+
+    header = "| workload | " + " | ".join(named_counters) + " |"
+    lines = [header, "|" + " --- |" * (len(named_counters) + 1)]
+    lines += [f"| {workload} | " + " | ".join(cells) + " |" for workload, cells in rows]
+    return f"ns per call, {moves:,} moves per workload\n\n" + "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--moves", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="also write the table to this file")
+    args = parser.parse_args()
+
+    table = run(args.moves, args.repeat)
+    print(table)
+    if args.output:
+        args.output.write_text(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Reference Day 01 dial logic.
+
+`count_clicks_on_zero` and `solve` follow human-solutions/01/python/main.py
+move for move. The faster engines in this package are checked against them.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Iterable
+
+MODULO = 100
+START = 50
+
+
+def count_clicks_on_zero(start: int, signed_steps: int) -> int:
+    """Count the clicks of one rotation that leave the dial pointing at 0."""
+    if signed_steps == 0:
+        return 0
+
+    start_norm = start % MODULO
+
+    if signed_steps > 0:
+        num_clicks = signed_steps
+        first_zero_click = MODULO if start_norm == 0 else MODULO - start_norm
+    else:
+        num_clicks = -signed_steps
+        first_zero_click = MODULO if start_norm == 0 else start_norm
+
+    if first_zero_click > num_clicks:
+        return 0
+
+    return 1 + (num_clicks - first_zero_click) // MODULO
+
+
+def parse_line(line: str) -> int:
+    """Turn a rotation like ``R17`` or ``L803`` into a signed step count."""
+    direction = line[0]
+    steps = int(line[1:])
+    return steps if direction == "R" else -steps
+
+
+def parse_steps(text: str) -> list[int]:
+    """Parse a whole rotation log the way the solutions do (``split("\\n")``)."""
+    return [parse_line(line) for line in text.strip().split("\n") if line]
+
+
+def solve(steps: Iterable[int], start: int = START) -> tuple[int, int]:
+    """Return ``(part1, part2)`` for a sequence of signed steps."""
+    dial = start
+    part1_counter = 0
+    part2_counter = 0
+
+    for signed_steps in steps:
+        part2_counter += count_clicks_on_zero(dial, signed_steps)
+        dial = (dial + signed_steps) % MODULO
+        if dial == 0:
+            part1_counter += 1
+
+    return part1_counter, part2_counter
+
+
+def random_log(moves: int, max_steps: int = 999, seed: int = 2025) -> str:
+    """Build a synthetic rotation log shaped like ``inputs/01.txt``."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.choice('LR')}{rng.randint(1, max_steps)}" for _ in range(moves)
+    ) + "\n"
@@ -0,0 +1,298 @@
+"""Editable Day 01 rotation log with fast re-query.
+
+`DialLog` keeps the moves in blocks at the nodes of an implicit treap (a
+segment tree that stays balanced under inserts and deletes). Every node caches
+the `DialSummary` of its subtree, so editing a move only refreshes the tables
+on one root-to-leaf path and "where is the dial after move i" is answered by
+walking a single path instead of replaying the log.
+
+    python -m tools.day01.dial_log --bench 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Iterable
+
+from tools.common import input_path
+from tools.day01 import dial
+from tools.day01.dial import MODULO, START, count_clicks_on_zero
+from tools.day01.summary import DialSummary
+
+BLOCK_SIZE = 32
+
+
+class _Node:
+    __slots__ = ("steps", "priority", "left", "right", "size", "own", "summary")
+
+    def __init__(self, steps: list[int], priority: float) -> None:
+        self.steps = steps
+        self.priority = priority
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.own = DialSummary.from_steps(steps)
+        self.size = len(steps)
+        self.summary = self.own
+
+    def refresh(self) -> None:
+        self.size = len(self.steps)
+        summary = self.own
+        if self.left:
+            self.size += self.left.size
+            summary = self.left.summary.then(summary)
+        if self.right:
+            self.size += self.right.size
+            summary = summary.then(self.right.summary)
+        self.summary = summary
+
+
+def _size(node: _Node | None) -> int:
+    return node.size if node else 0
+
+
+def _build(blocks: list[list[int]], low: int, high: int, ceiling: float, rng: random.Random) -> _Node | None:
+    if low >= high:
+        return None
+    mid = (low + high) // 2
+    node = _Node(blocks[mid], ceiling * rng.random())
+    node.left = _build(blocks, low, mid, node.priority, rng)
+    node.right = _build(blocks, mid + 1, high, node.priority, rng)
+    node.refresh()
+    return node
+
+
+def _rotate_right(node: _Node) -> _Node:
+    top = node.left
+    node.left = top.right
+    top.right = node
+    node.refresh()
+    top.refresh()
+    return top
+
+
+def _rotate_left(node: _Node) -> _Node:
+    top = node.right
+    node.right = top.left
+    top.left = node
+    node.refresh()
+    top.refresh()
+    return top
+
+
+def _merge(left: _Node | None, right: _Node | None) -> _Node | None:
+    if not left or not right:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.refresh()
+        return left
+    right.left = _merge(left, right.left)
+    right.refresh()
+    return right
+
+
+def _prepend(node: _Node | None, new: _Node) -> _Node:
+    """Insert ``new`` as the first block of the subtree rooted at ``node``."""
+    if not node:
+        return new
+    node.left = _prepend(node.left, new)
+    if node.left.priority > node.priority:
+        return _rotate_right(node)
+    node.refresh()
+    return node
+
+
+class DialLog:
+    """A rotation log supporting O(log n) edits and prefix queries."""
+
+    def __init__(self, steps: Iterable[int] = (), start: int = START, seed: int | None = None) -> None:
+        self.start = start
+        self._rng = random.Random(seed)
+        steps = list(steps)
+        blocks = [steps[i:i + BLOCK_SIZE] for i in range(0, len(steps), BLOCK_SIZE)]
+        self._root = _build(blocks, 0, len(blocks), 1.0, self._rng)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def _index(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("move index out of range")
+        return index
+
+    def _locate(self, index: int) -> tuple[_Node, int]:
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + len(node.steps):
+                return node, index - left_size
+            else:
+                index -= left_size + len(node.steps)
+                node = node.right
+
+    def __getitem__(self, index: int) -> int:
+        node, offset = self._locate(self._index(index))
+        return node.steps[offset]
+
+    def __setitem__(self, index: int, signed_steps: int) -> None:
+        self._root = self._set(self._root, self._index(index), signed_steps)
+
+    def __delitem__(self, index: int) -> None:
+        self._root = self._delete(self._root, self._index(index))
+
+    def insert(self, index: int, signed_steps: int) -> None:
+        """Insert a move before ``index``, like `list.insert`."""
+        size = len(self)
+        if index < 0:
+            index = max(index + size, 0)
+        self._root = self._insert(self._root, min(index, size), signed_steps)
+
+    def append(self, signed_steps: int) -> None:
+        self.insert(len(self), signed_steps)
+
+    def answers(self) -> tuple[int, int]:
+        """Return ``(part1, part2)`` for the whole log."""
+        if not self._root:
+            return 0, 0
+        return self._root.summary.answers(self.start)
+
+    def after(self, index: int) -> tuple[int, int, int]:
+        """Return ``(position, part1, part2)`` once moves ``0..index`` have run."""
+        remaining = self._index(index) + 1
+        position = self.start % MODULO
+        landed = zeros = 0
+        node = self._root
+
+        while node:
+            left = node.left
+            if remaining <= _size(left):
+                node = left
+                continue
+            if left:
+                landed += left.summary.landed[position]
+                zeros += left.summary.zeros[position]
+                position = left.summary.end[position]
+                remaining -= left.size
+            if remaining < len(node.steps):
+                for signed_steps in node.steps[:remaining]:
+                    zeros += count_clicks_on_zero(position, signed_steps)
+                    position = (position + signed_steps) % MODULO
+                    if position == 0:
+                        landed += 1
+                return position, landed, zeros
+            landed += node.own.landed[position]
+            zeros += node.own.zeros[position]
+            position = node.own.end[position]
+            remaining -= len(node.steps)
+            if not remaining:
+                return position, landed, zeros
+            node = node.right
+
+        raise AssertionError("subtree sizes are inconsistent")
+
+    def _set(self, node: _Node, index: int, signed_steps: int) -> _Node:
+        left_size = _size(node.left)
+        if index < left_size:
+            node.left = self._set(node.left, index, signed_steps)
+        elif index < left_size + len(node.steps):
+            node.steps[index - left_size] = signed_steps
+            node.own = DialSummary.from_steps(node.steps)
+        else:
+            node.right = self._set(node.right, index - left_size - len(node.steps), signed_steps)
+        node.refresh()
+        return node
+
+    def _insert(self, node: _Node | None, index: int, signed_steps: int) -> _Node:
+        if not node:
+            return _Node([signed_steps], self._rng.random())
+
+        left_size = _size(node.left)
+        if index < left_size:
+            node.left = self._insert(node.left, index, signed_steps)
+            if node.left.priority > node.priority:
+                return _rotate_right(node)
+        elif index <= left_size + len(node.steps):
+            node.steps.insert(index - left_size, signed_steps)
+            if len(node.steps) > 2 * BLOCK_SIZE:
+                node.steps, tail = node.steps[:BLOCK_SIZE], node.steps[BLOCK_SIZE:]
+                node.right = _prepend(node.right, _Node(tail, self._rng.random()))
+            node.own = DialSummary.from_steps(node.steps)
+            if node.right and node.right.priority > node.priority:
+                return _rotate_left(node)
+        else:
+            node.right = self._insert(node.right, index - left_size - len(node.steps), signed_steps)
+            if node.right.priority > node.priority:
+                return _rotate_left(node)
+        node.refresh()
+        return node
+
+    def _delete(self, node: _Node, index: int) -> _Node | None:
+        left_size = _size(node.left)
+        if index < left_size:
+            node.left = self._delete(node.left, index)
+        elif index < left_size + len(node.steps):
+            del node.steps[index - left_size]
+            if not node.steps:
+                return _merge(node.left, node.right)
+            node.own = DialSummary.from_steps(node.steps)
+        else:
+            node.right = self._delete(node.right, index - left_size - len(node.steps))
+        node.refresh()
+        return node
+
+
+def benchmark(moves: int, edits: int) -> None:
+    steps = dial.parse_steps(dial.random_log(moves))
+    rng = random.Random(1)
+
+    started = time.perf_counter()
+    log = DialLog(steps, seed=1)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dial.solve(steps)
+    replay = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(edits):
+        log[rng.randrange(len(log))] = rng.randint(-999, 999)
+        log.answers()
+    edit = (time.perf_counter() - started) / edits
+
+    started = time.perf_counter()
+    for _ in range(edits):
+        log.after(rng.randrange(len(log)))
+    query = (time.perf_counter() - started) / edits
+
+    print(f"moves: {moves:,}")
+    print(f"build:          {build:.3f} s")
+    print(f"full replay:    {replay * 1e3:.2f} ms")
+    print(f"edit + answers: {edit * 1e3:.3f} ms")
+    print(f"after(i):       {query * 1e3:.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="time edits and queries against a full replay")
+    parser.add_argument("--edits", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.edits)
+        return
+
+    log = DialLog(dial.parse_steps(input_path("01").read_text()))
+    part1, part2 = log.answers()
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
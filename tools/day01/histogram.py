@@ -0,0 +1,99 @@
+"""Per-position hit histogram for Day 01.
+
+Counts, for every one of the 100 positions, how many moves end there and how
+many clicks pass through it, in a single pass whatever the number of targets.
+Landings are a ``bincount``. The clicks of a move are its full revolutions,
+which touch every position, plus one partial arc, which is a range update on a
+difference array. Position 0 reproduces the part-1/part-2 answers.
+
+    python -m tools.day01.histogram [input]
+    python -m tools.day01.histogram --bench 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from tools.common import best_time, input_path
+from tools.day01 import dial
+from tools.day01.dial import MODULO, START
+from tools.day01.parser import load_steps, parse_buffer
+from tools.day01.vectorized import solve_array
+
+
+def visit_counts(steps: np.ndarray, start: int = START) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(landed, clicked)``: per position, moves ending there and clicks onto it."""
+    steps = np.asarray(steps, dtype=np.int64)
+    after = (start + np.cumsum(steps % MODULO)) % MODULO
+    before = np.empty_like(after)
+    before[:1] = start % MODULO
+    before[1:] = after[:-1]
+
+    forward = steps >= 0
+    distance = np.abs(steps)
+    arc = distance % MODULO
+    # First position clicked onto by the partial arc, walking upwards.
+    low = np.where(forward, before + 1, before - arc) % MODULO
+
+    # Arcs may wrap past 99, so count them on a doubled dial and fold it.
+    partial = arc > 0
+    diff = np.bincount(low[partial], minlength=2 * MODULO + 1)
+    diff -= np.bincount(low[partial] + arc[partial], minlength=2 * MODULO + 1)
+    doubled = np.cumsum(diff[: 2 * MODULO])
+    clicked = doubled[:MODULO] + doubled[MODULO:] + int((distance // MODULO).sum())
+
+    landed = np.bincount(after, minlength=MODULO)
+    return landed, clicked
+
+
+def position_histogram(steps: np.ndarray, start: int = START) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(landed, passed)``: per position, moves ending there and clicks passing through.
+
+    A click that ends a move counts as a landing, not a pass-through. So
+    ``landed[0]`` is part 1, and ``landed[0] + passed[0]`` is part 2 as long as
+    the log has no zero-step moves (those land without clicking).
+    """
+    steps = np.asarray(steps, dtype=np.int64)
+    landed, clicked = visit_counts(steps, start)
+    after = (start + np.cumsum(steps % MODULO)) % MODULO
+    passed = clicked - np.bincount(after[steps != 0], minlength=MODULO)
+    return landed, passed
+
+
+def benchmark(moves: int, repeat: int) -> None:
+    array = parse_buffer(dial.random_log(moves).encode())
+    landed, passed = position_histogram(array)
+    if (landed[0], landed[0] + passed[0]) != solve_array(array):
+        raise AssertionError("histogram disagrees with the zero-click count at position 0")
+
+    histogram = best_time(lambda: position_histogram(array), repeat)
+    print(f"moves: {moves:,}")
+    print(f"{'targets':>8}{'per target (s)':>16}{'histogram (s)':>16}")
+    for targets in (1, 10, 100):
+        # Clicks onto position t from START are clicks onto 0 from START - t.
+        per_target = best_time(lambda: [solve_array(array, START - t) for t in range(targets)], 1, 0)
+        print(f"{targets:>8}{per_target:>16.4f}{histogram:>16.4f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("01"))
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="compare with one run per target")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.repeat)
+        return
+
+    landed, passed = position_histogram(load_steps(args.input))
+    print("position\tlanded\tpassed")
+    for position in range(MODULO):
+        print(f"{position}\t{landed[position]}\t{passed[position]}")
+
+
+if __name__ == "__main__":
+    main()
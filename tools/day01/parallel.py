@@ -0,0 +1,99 @@
+"""Multi-core Day 01 solver built on composable `DialSummary` tables.
+
+The log is cut into line-aligned byte ranges. Each worker process reads its own
+range and summarizes it for all 100 start positions; the parent folds the
+summaries in order and reads off the answers for the real start position.
+
+    python -m tools.day01.parallel [input] [--workers N]
+    python -m tools.day01.parallel --bench 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from pathlib import Path
+from typing import Iterator
+
+from tools.common import input_path, line_aligned_shards, read_range
+from tools.day01 import dial
+from tools.day01.dial import START
+from tools.day01.summary import DialSummary
+
+CHUNKS_PER_WORKER = 4
+
+
+def _steps(data: bytes) -> Iterator[int]:
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if line:
+            steps = int(line[1:])
+            yield steps if line[:1] == b"R" else -steps
+
+
+def _summarize_range(task: tuple[Path, int, int]) -> DialSummary:
+    return DialSummary.from_steps(_steps(read_range(*task)))
+
+
+def summarize_file(path: Path, workers: int | None = None) -> DialSummary:
+    """Summarize a whole log using a pool of ``workers`` processes."""
+    workers = workers or os.cpu_count() or 1
+    tasks = [(path, start, end) for start, end in line_aligned_shards(path, workers * CHUNKS_PER_WORKER)]
+    if workers == 1:
+        return reduce(DialSummary.then, map(_summarize_range, tasks), DialSummary.identity())
+    with ProcessPoolExecutor(workers) as pool:
+        return reduce(DialSummary.then, pool.map(_summarize_range, tasks), DialSummary.identity())
+
+
+def solve_parallel(path: Path, workers: int | None = None, start: int = START) -> tuple[int, int]:
+    return summarize_file(path, workers).answers(start)
+
+
+def benchmark(moves: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "01.txt"
+        path.write_text(dial.random_log(moves))
+        megabytes = path.stat().st_size / 1e6
+        print(f"moves: {moves:,} ({megabytes:.1f} MB), cpus: {os.cpu_count()}")
+
+        started = time.perf_counter()
+        expected = dial.solve(dial.parse_steps(path.read_text()))
+        serial = time.perf_counter() - started
+        print(f"{'mode':<12}{'time (s)':>10}{'MB/s':>10}{'speedup':>10}")
+        print(f"{'serial':<12}{serial:>10.3f}{megabytes / serial:>10.1f}{1:>9.1f}x")
+
+        workers = 1
+        while True:
+            started = time.perf_counter()
+            actual = solve_parallel(path, workers)
+            elapsed = time.perf_counter() - started
+            if actual != expected:
+                raise AssertionError(f"{workers} workers: {actual} != serial {expected}")
+            print(f"{f'{workers} workers':<12}{elapsed:>10.3f}{megabytes / elapsed:>10.1f}{serial / elapsed:>9.1f}x")
+            if workers >= (os.cpu_count() or 1):
+                break
+            workers = min(workers * 2, os.cpu_count() or 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("01"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="time 1..N workers against the serial loop")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+        return
+
+    part1, part2 = solve_parallel(args.input, args.workers)
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
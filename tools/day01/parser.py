@@ -0,0 +1,147 @@
+"""Bulk parser for L/R rotation logs.
+
+The input is memory-mapped and decoded window by window with NumPy: newline
+positions give the line bounds, direction bytes are read at the line starts and
+digit runs are summed column by column. No per-line ``str`` or ``int`` objects
+are created. Malformed input raises `ParseError` with the byte offset.
+
+    python -m tools.day01.parser [input]
+    python -m tools.day01.parser --bench 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from tools.common import best_time, input_path
+from tools.day01 import dial
+
+WINDOW = 1 << 26
+MAX_DIGITS = 18
+
+NEWLINE, CARRIAGE_RETURN = ord("\n"), ord("\r")
+LEFT, RIGHT, ZERO, NINE = ord("L"), ord("R"), ord("0"), ord("9")
+
+
+class ParseError(ValueError):
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(f"{message} at byte {offset}")
+        self.offset = offset
+
+
+def _parse_window(buf: np.ndarray, base: int) -> np.ndarray:
+    """Parse whole lines in ``buf``; ``base`` is its offset in the input."""
+    newlines = np.flatnonzero(buf == NEWLINE)
+    ends = newlines if buf.size and buf[-1] == NEWLINE else np.append(newlines, buf.size)
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = newlines[: ends.size - 1] + 1
+
+    # Allow CRLF line endings by stepping the end back over a trailing \r.
+    has_cr = ends > starts
+    has_cr[has_cr] = buf[ends[has_cr] - 1] == CARRIAGE_RETURN
+    ends = ends - has_cr
+    carriage_returns = ends[has_cr]
+
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    lengths = ends - starts - 1
+
+    problems = []
+    directions = buf[starts]
+    bad = np.flatnonzero((directions != LEFT) & (directions != RIGHT))
+    if bad.size:
+        problems.append((starts[bad[0]], "expected L or R"))
+    short = np.flatnonzero(lengths == 0)
+    if short.size:
+        problems.append((ends[short[0]], "expected a digit"))
+    long = np.flatnonzero(lengths > MAX_DIGITS)
+    if long.size:
+        problems.append((starts[long[0]], f"more than {MAX_DIGITS} digits"))
+
+    # Every byte that is not a newline, a CRLF's \r or a line's direction must be a digit.
+    allowed = (buf >= ZERO) & (buf <= NINE)
+    allowed[newlines] = True
+    allowed[carriage_returns] = True
+    allowed[starts] = True
+    if not allowed.all():
+        stray = int(np.argmin(allowed))
+        problems.append((stray, f"unexpected byte {bytes(buf[stray:stray + 1])!r}"))
+
+    if problems:
+        offset, message = min(problems)
+        raise ParseError(message, base + int(offset))
+
+    steps = np.zeros(starts.size, dtype=np.int64)
+    weight = 1
+    for column in range(int(lengths.max(initial=0))):
+        present = lengths > column
+        digits = buf[np.where(present, ends - 1 - column, starts)].astype(np.int64) - ZERO
+        steps += np.where(present, digits, 0) * weight
+        weight *= 10
+
+    np.negative(steps, out=steps, where=directions == LEFT)
+    return steps
+
+
+def parse_buffer(data: bytes | bytearray | memoryview | np.ndarray) -> np.ndarray:
+    """Decode a rotation log held in any buffer into an int64 array of signed steps."""
+    buf = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    parts = []
+    position = 0
+    while position < buf.size:
+        cut = min(position + WINDOW, buf.size)
+        if cut < buf.size:
+            newlines = np.flatnonzero(buf[position:cut] == NEWLINE)
+            if not newlines.size:
+                raise ParseError(f"line longer than {WINDOW} bytes", position)
+            cut = position + int(newlines[-1]) + 1
+        parts.append(_parse_window(buf[position:cut], position))
+        position = cut
+    if not parts:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+
+def load_steps(path: Path) -> np.ndarray:
+    """Memory-map ``path`` and parse it."""
+    if not path.stat().st_size:
+        return np.zeros(0, dtype=np.int64)
+    return parse_buffer(np.memmap(path, dtype=np.uint8, mode="r"))
+
+
+def benchmark(moves: int, repeat: int) -> None:
+    text = dial.random_log(moves)
+    data = text.encode()
+    if parse_buffer(data).tolist() != dial.parse_steps(text):
+        raise AssertionError("bulk parser disagrees with split('\\n') parsing")
+
+    megabytes = len(data) / 1e6
+    split = best_time(lambda: dial.parse_steps(data.decode()), repeat)
+    bulk = best_time(lambda: parse_buffer(data), repeat)
+    print(f"moves: {moves:,} ({megabytes:.1f} MB)")
+    print(f"{'parser':<14}{'time (s)':>10}{'MB/s':>10}")
+    for label, elapsed in (('split("\\n")', split), ("bulk", bulk)):
+        print(f"{label:<14}{elapsed:>10.4f}{megabytes / elapsed:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("01"))
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="report MB/s against split('\\n') parsing")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.repeat)
+        return
+
+    steps = load_steps(args.input)
+    print(f"{steps.size} moves, {steps.nbytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
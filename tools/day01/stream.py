@@ -0,0 +1,134 @@
+"""Constant-memory streaming solver for Day 01.
+
+The log is read in fixed-size byte chunks. A line cut at a chunk edge is held
+back until the next chunk completes it, and the dial state carries over, so
+peak memory depends on the chunk size rather than the log size. Lines are
+walked in place with ``bytes.find`` rather than split into a list, so the
+peak is a small multiple of the chunk size (the chunk, its copy joined to the
+held-back line, and the reader's buffer) instead of one object per line.
+
+    python -m tools.day01.stream [input | -]
+    zcat huge.log.gz | python -m tools.day01.stream -
+    python -m tools.day01.stream --bench 64 [--chunk-size 65536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import BinaryIO
+
+from tools.common import input_path
+from tools.day01 import dial
+from tools.day01.dial import MODULO, START, count_clicks_on_zero
+
+CHUNK_SIZE = 1 << 20
+
+
+class DialStream:
+    """Day 01 state that can be fed arbitrary byte chunks of a rotation log."""
+
+    def __init__(self, start: int = START) -> None:
+        self.dial = start
+        self.part1_counter = 0
+        self.part2_counter = 0
+        self._partial = b""
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._partial + chunk
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            self._rotate(data[start:end])
+            start = end + 1
+        self._partial = data[start:]
+
+    def close(self) -> tuple[int, int]:
+        """Flush a final unterminated line and return ``(part1, part2)``."""
+        if self._partial:
+            self._rotate(self._partial)
+            self._partial = b""
+        return self.part1_counter, self.part2_counter
+
+    def _rotate(self, line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+        steps = int(line[1:])
+        signed_steps = steps if line[:1] == b"R" else -steps
+
+        self.part2_counter += count_clicks_on_zero(self.dial, signed_steps)
+        self.dial = (self.dial + signed_steps) % MODULO
+        if self.dial == 0:
+            self.part1_counter += 1
+
+
+def solve_stream(stream: BinaryIO, chunk_size: int = CHUNK_SIZE, start: int = START) -> tuple[int, int]:
+    """Solve a rotation log from any binary stream (file, pipe, socket)."""
+    state = DialStream(start)
+    while chunk := stream.read(chunk_size):
+        state.feed(chunk)
+    return state.close()
+
+
+class _SyntheticLog(io.RawIOBase):
+    """Readable stream that produces a random log lazily, for the benchmark."""
+
+    def __init__(self, moves: int, block: int = 1_000) -> None:
+        self._remaining = moves
+        self._block = block
+        self._seed = 0
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while len(self._buffer) < size and self._remaining:
+            count = min(self._block, self._remaining)
+            self._buffer += dial.random_log(count, seed=self._seed).encode()
+            self._remaining -= count
+            self._seed += 1
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def benchmark(chunks: int, chunk_size: int) -> None:
+    # Sizes are counted in chunks so that even the smallest log is read in several of them.
+    bytes_per_move = len(dial.random_log(10_000, seed=0)) / 10_000
+    print(f"chunk size: {chunk_size:,} bytes (~{chunk_size / bytes_per_move:,.0f} moves)")
+    print(f"{'chunks':>8}{'moves':>14}{'peak (KiB)':>14}")
+    for count in sorted({max(chunks // 16, 2), max(chunks // 4, 2), max(chunks, 2)}):
+        moves = int(count * chunk_size / bytes_per_move)
+        tracemalloc.start()
+        solve_stream(_SyntheticLog(moves), chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{count:>8,}{moves:>14,}{peak / 1024:>14,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default=str(input_path("01")), help="log path, or - for stdin")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--bench", type=int, metavar="CHUNKS", help="report peak memory for logs of up to CHUNKS chunks")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.chunk_size)
+        return
+
+    if args.input == "-":
+        part1, part2 = solve_stream(sys.stdin.buffer, args.chunk_size)
+    else:
+        with Path(args.input).open("rb") as file:
+            part1, part2 = solve_stream(file, args.chunk_size)
+
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Composable summaries of a run of Day 01 moves.
+
+A `DialSummary` records, for each of the 100 start positions, where the dial
+ends up, how many moves leave it on 0 (part 1) and how many clicks land on 0
+(part 2). Summaries compose associatively, so chunks of a log can be summarized
+independently and folded together in order.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from tools.day01.dial import MODULO
+
+
+class DialSummary:
+    __slots__ = ("end", "landed", "zeros")
+
+    def __init__(self, end: list[int], landed: list[int], zeros: list[int]) -> None:
+        self.end = end
+        self.landed = landed
+        self.zeros = zeros
+
+    @classmethod
+    def identity(cls) -> DialSummary:
+        return cls(list(range(MODULO)), [0] * MODULO, [0] * MODULO)
+
+    @classmethod
+    def from_steps(cls, steps: Iterable[int]) -> DialSummary:
+        """Summarize moves in one pass, whatever the start position.
+
+        The moves are replayed once from position 0. Every click of that replay
+        visits a position ``v``; a dial started at ``p`` is then on 0 exactly
+        when ``(p + v) % 100 == 0``. Full revolutions visit every position, and
+        the partial arc of each move is one range update on a difference array.
+        """
+        position = 0
+        laps = 0
+        landed_at = [0] * MODULO
+        diff = [0] * (MODULO + 1)
+
+        for signed_steps in steps:
+            if signed_steps >= 0:
+                revolutions, arc = divmod(signed_steps, MODULO)
+                low = (position + 1) % MODULO
+            else:
+                revolutions, arc = divmod(-signed_steps, MODULO)
+                low = (position - arc) % MODULO
+            laps += revolutions
+            if arc:
+                high = low + arc
+                diff[low] += 1
+                if high <= MODULO:
+                    diff[high] -= 1
+                else:
+                    diff[MODULO] -= 1
+                    diff[0] += 1
+                    diff[high - MODULO] -= 1
+            position = (position + signed_steps) % MODULO
+            landed_at[position] += 1
+
+        visits = []
+        running = laps
+        for delta in diff[:MODULO]:
+            running += delta
+            visits.append(running)
+
+        return cls(
+            [(start + position) % MODULO for start in range(MODULO)],
+            [landed_at[-start % MODULO] for start in range(MODULO)],
+            [visits[-start % MODULO] for start in range(MODULO)],
+        )
+
+    def then(self, other: DialSummary) -> DialSummary:
+        """Summary of the moves in ``self`` followed by those in ``other``."""
+        return DialSummary(
+            [other.end[mid] for mid in self.end],
+            [count + other.landed[mid] for count, mid in zip(self.landed, self.end)],
+            [count + other.zeros[mid] for count, mid in zip(self.zeros, self.end)],
+        )
+
+    def answers(self, start: int) -> tuple[int, int]:
+        """Return ``(part1, part2)`` for a dial that starts at ``start``."""
+        start %= MODULO
+        return self.landed[start], self.zeros[start]
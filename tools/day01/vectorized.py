@@ -0,0 +1,88 @@
+"""Vectorized NumPy engine for Day 01.
+
+The whole log becomes one int64 array of signed steps. Final positions are a
+cumulative sum mod 100. Zero clicks come from floor division: a move of ``s``
+clicks starting ``d`` clicks past the last zero (measured in the direction of
+travel) hits zero ``(d + |s|) // 100`` times.
+
+    python -m tools.day01.vectorized [input]
+    python -m tools.day01.vectorized --bench 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from tools.common import best_time, input_path
+from tools.day01 import dial
+from tools.day01.dial import MODULO, START
+from tools.day01.parser import load_steps, parse_buffer
+
+
+def solve_array(steps: np.ndarray, start: int = START) -> tuple[int, int]:
+    """Return ``(part1, part2)`` for an array of signed steps."""
+    steps = np.asarray(steps, dtype=np.int64)
+    if steps.size == 0:
+        return 0, 0
+
+    after = (start + np.cumsum(steps % MODULO)) % MODULO
+    before = np.empty_like(after)
+    before[0] = start % MODULO
+    before[1:] = after[:-1]
+
+    part1 = int(np.count_nonzero(after == 0))
+
+    # Clicks already travelled past the last zero, in the direction of the move.
+    travelled = np.where(steps > 0, before, (MODULO - before) % MODULO)
+    part2 = int(((travelled + np.abs(steps)) // MODULO).sum())
+
+    return part1, part2
+
+
+def benchmark(moves: int, repeat: int) -> None:
+    text = dial.random_log(moves)
+    data = text.encode()
+    print(f"moves: {moves:,} ({len(data) / 1e6:.1f} MB)")
+
+    expected = dial.solve(dial.parse_steps(text))
+    actual = solve_array(parse_buffer(data))
+    if actual != expected:
+        raise AssertionError(f"vectorized {actual} != reference {expected}")
+
+    parsed = dial.parse_steps(text)
+    array = parse_buffer(data)
+    rows = [
+        ("parse", best_time(lambda: dial.parse_steps(text), repeat),
+         best_time(lambda: parse_buffer(data), repeat)),
+        ("solve", best_time(lambda: dial.solve(parsed), repeat),
+         best_time(lambda: solve_array(array), repeat)),
+        ("total", best_time(lambda: dial.solve(dial.parse_steps(text)), repeat),
+         best_time(lambda: solve_array(parse_buffer(data)), repeat)),
+    ]
+
+    print(f"{'stage':<8}{'loop (s)':>12}{'numpy (s)':>12}{'speedup':>10}")
+    for stage, loop, vectorized in rows:
+        print(f"{stage:<8}{loop:>12.4f}{vectorized:>12.4f}{loop / vectorized:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("01"))
+    parser.add_argument("--bench", type=int, metavar="MOVES", help="benchmark against the reference loop")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.repeat)
+        return
+
+    part1, part2 = solve_array(load_steps(args.input))
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
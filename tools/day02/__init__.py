@@ -0,0 +1 @@
+"""Day 02 (Gift Shop) invalid-ID engines."""
@@ -0,0 +1,160 @@
+"""Benchmark of the Day 02 checking strategies by digit length and hit density.
+
+Strategies compared on the same integers:
+
+- ``regex``: the backreference patterns of human-solutions/02 (`tools.day02.ids`)
+- ``multiply``: ``pattern * repetitions == s``, from ai-solutions/02/opus-4.5
+  (gemini-3-pro and gpt-5.1-codex inline the same test)
+- ``segments``: slice-by-slice comparison, from ai-solutions/02/composer-1
+- ``numpy``: `tools.day02.vector_check.invalid_masks` over the whole sample
+
+For each digit length from 2 to 18 and each hit density, a sample mixing
+invalid IDs with random other IDs is checked in-process with warmup and repeats.
+Every strategy is cross-checked against the regex. The output is a Markdown
+table in ns per integer, the fastest per-integer checker of each cell and the
+crossover points (the digit lengths where it changes). NumPy only pays off on
+whole arrays, so it is reported as a speedup over that checker instead of
+competing with it. ``--json`` writes the winners per bucket so a dispatcher can
+choose a checker per bucket.
+
+    python -m tools.day02.bench_checkers [--part 2] [--sample 20000] [--json winners.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from tools.common import best_time, load_solution
+from tools.day02.generate import divisors, repunit
+from tools.day02.ids import is_invalid_part1, is_invalid_part2
+from tools.day02.vector_check import invalid_masks, string_invalid_part1, string_invalid_part2
+
+DIGITS = range(2, 19)
+DENSITIES = (0.0, 0.01, 0.5, 1.0)
+BATCHED = "numpy"
+
+
+def strategies(part: int) -> dict[str, Callable[[list[int]], list[bool]]]:
+    """Name -> function marking the invalid integers of a sample."""
+    opus = load_solution("ai-solutions/02/opus-4.5/python/main.py")
+    if part == 1:
+        regex, multiply, segments = is_invalid_part1, opus.is_double_repeated, string_invalid_part1
+    else:
+        regex, multiply, segments = is_invalid_part2, opus.is_repeated_pattern, string_invalid_part2
+
+    def vectorized(sample: list[int]) -> list[bool]:
+        return invalid_masks(np.array(sample, dtype=np.int64))[part - 1].tolist()
+
+    return {
+        "regex": lambda sample: [regex(n) for n in sample],
+        "multiply": lambda sample: [multiply(n) for n in sample],
+        "segments": lambda sample: [segments(n) for n in sample],
+        BATCHED: vectorized,
+    }
+
+
+def hit_periods(digits: int, part: int) -> list[int]:
+    """Periods that make a ``digits``-long ID invalid."""
+    if part == 1:
+        return [digits // 2] if digits % 2 == 0 else []
+    return divisors(digits)
+
+
+def sample(digits: int, density: float, size: int, part: int, rng: random.Random) -> list[int]:
+    """``size`` IDs of ``digits`` digits, a ``density`` share of them invalid."""
+    check = is_invalid_part1 if part == 1 else is_invalid_part2
+    periods = hit_periods(digits, part)
+    hits = round(size * density) if periods else 0
+
+    values = []
+    for _ in range(hits):
+        period = rng.choice(periods)
+        values.append(rng.randint(10 ** (period - 1), 10**period - 1) * repunit(digits, period))
+    while len(values) < size:
+        value = rng.randint(10 ** (digits - 1), 10**digits - 1)
+        if not check(value):
+            values.append(value)
+    rng.shuffle(values)
+    return values
+
+
+def run(part: int, size: int, repeat: int, seed: int = 2025) -> tuple[list[dict], dict[float, list[tuple[int, str]]]]:
+    """Time every strategy per bucket; returns the rows and the crossovers per density."""
+    rng = random.Random(seed)
+    named = strategies(part)
+    rows = []
+    for density in DENSITIES:
+        for digits in DIGITS:
+            if density and not hit_periods(digits, part):
+                continue
+            values = sample(digits, density, size, part, rng)
+            expected = named["regex"](values)
+            timings = {}
+            for name, check in named.items():
+                if check(values) != expected:
+                    raise AssertionError(f"{name} disagrees with the regex at {digits} digits, density {density}")
+                timings[name] = best_time(lambda: check(values), repeat) / size * 1e9
+            winner = min((name for name in timings if name != BATCHED), key=timings.get)
+            speedup = timings[winner] / timings[BATCHED]
+            rows.append({"density": density, "digits": digits, "ns": timings, "winner": winner, "speedup": speedup})
+
+    crossovers: dict[float, list[tuple[int, str]]] = {}
+    for row in rows:
+        changes = crossovers.setdefault(row["density"], [])
+        if not changes or changes[-1][1] != row["winner"]:
+            changes.append((row["digits"], row["winner"]))
+    return rows, crossovers
+
+
+def render(rows: list[dict], crossovers: dict[float, list[tuple[int, str]]], part: int, size: int) -> str:
+    names = list(rows[0]["ns"])
+    lines = [
+        f"Part {part}, ns per integer, {size:,} integers per cell",
+        "",
+        "| density | digits | " + " | ".join(names) + f" | fastest per integer | {BATCHED} speedup |",
+        "|" + " ---: |" * (len(names) + 2) + " --- | ---: |",
+    ]
+    for row in rows:
+        cells = " | ".join(f"{row['ns'][name]:,.0f}" for name in names)
+        lines.append(f"| {row['density']:.0%} | {row['digits']} | {cells} | {row['winner']} | {row['speedup']:.1f}x |")
+
+    lines += ["", "Crossovers (fastest per-integer checker from that digit length on):", ""]
+    for density, changes in crossovers.items():
+        steps = ", ".join(f"{name} from {digits}" for digits, name in changes)
+        lines.append(f"- density {density:.0%}: {steps}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--sample", type=int, default=20_000, help="integers per digit length and density")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="also write the table to this file")
+    parser.add_argument("--json", type=Path, help="write the winning strategy per bucket")
+    args = parser.parse_args()
+
+    rows, crossovers = run(args.part, args.sample, args.repeat)
+    table = render(rows, crossovers, args.part, args.sample)
+    print(table)
+    if args.output:
+        args.output.write_text(table)
+    if args.json:
+        buckets = {
+            f"{density:g}": {
+                str(row["digits"]): {"winner": row["winner"], f"{BATCHED}_speedup": round(row["speedup"], 2)}
+                for row in rows if row["density"] == density
+            }
+            for density in crossovers
+        }
+        args.json.write_text(json.dumps({"part": args.part, "buckets": buckets}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Closed-form Day 02 sums, without enumerating the invalid IDs.
+
+For a digit length and period, the IDs in a range are ``pattern * repunit`` for
+a contiguous run of patterns, so their count and sum are an arithmetic series.
+
+Part 2 needs the IDs of a given length with *any* shorter period. An ID with
+period ``d`` also has every period that ``d`` divides, so the union is taken
+over the periods ``length / p`` for primes ``p`` dividing the length, and
+inclusion-exclusion over those primes gives Möbius weights:
+
+    S(length) = sum over k | length, k > 1, of -mu(k) * S_period(length / k)
+
+Each range costs O(digits * divisors).
+
+    python -m tools.day02.closed_form [input]
+    python -m tools.day02.closed_form --check 2000
+    python -m tools.day02.closed_form --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from functools import cache
+from pathlib import Path
+from typing import Iterable
+
+from tools.common import input_path
+from tools.day02.generate import repunit
+from tools.day02.ids import Range, is_invalid_part1, is_invalid_part2, parse_ranges
+from tools.intervals import IntervalSet
+
+
+def mobius(n: int) -> int:
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    return -result if n > 1 else result
+
+
+@cache
+def period_weights(length: int) -> list[tuple[int, int]]:
+    """``(length // k, -mu(k))`` for the divisors ``k > 1`` of ``length`` with ``mu(k) != 0``."""
+    return [(length // k, -mobius(k)) for k in range(2, length + 1) if length % k == 0 and mobius(k)]
+
+
+def _series(low: int, high: int, length: int, period: int) -> tuple[int, int]:
+    """Count and sum of ``period``-repeats of ``length`` digits within ``low..high``."""
+    multiplier = repunit(length, period)
+    first = max(-(-low // multiplier), 10 ** (period - 1))
+    last = min(high // multiplier, 10**period - 1)
+    if first > last:
+        return 0, 0
+    count = last - first + 1
+    return count, multiplier * (first + last) * count // 2
+
+
+def range_totals(start: int, end: int, part: int) -> tuple[int, int]:
+    """Return ``(count, sum)`` of the invalid IDs in ``start..end``."""
+    count = total = 0
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        if low > high:
+            continue
+        if part == 1:
+            if length % 2 == 0:
+                c, s = _series(low, high, length, length // 2)
+                count += c
+                total += s
+            continue
+        for period, weight in period_weights(length):
+            c, s = _series(low, high, length, period)
+            count += weight * c
+            total += weight * s
+    return count, total
+
+
+def solve(ranges: Iterable[Range]) -> tuple[int, int]:
+    """Return ``(part1, part2)``; overlapping ranges count an ID once."""
+    merged = IntervalSet.from_ranges(ranges)
+    part1 = sum(range_totals(start, end, 1)[1] for start, end in merged)
+    part2 = sum(range_totals(start, end, 2)[1] for start, end in merged)
+    return part1, part2
+
+
+def check(trials: int, seed: int = 2025) -> None:
+    """Compare with the regex patterns on random small ranges."""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        start = rng.randint(0, 10 ** rng.randint(1, 7))
+        end = start + rng.randint(0, 5000)
+        for part, is_invalid in ((1, is_invalid_part1), (2, is_invalid_part2)):
+            hits = [i for i in range(start, end + 1) if is_invalid(i)]
+            expected = (len(hits), sum(hits))
+            actual = range_totals(start, end, part)
+            if actual != expected:
+                raise AssertionError(f"{start}-{end} part {part}: {actual} != regex {expected}")
+    print(f"{trials} random ranges match the regex scan")
+
+
+def benchmark() -> None:
+    for start, end in ((11, 10**6), (10**9, 10**12), (1, 10**18 - 1)):
+        started = time.perf_counter()
+        (c1, _), (c2, _) = range_totals(start, end, 1), range_totals(start, end, 2)
+        elapsed = time.perf_counter() - started
+        print(f"{start}-{end}: {c1:,} part-1 / {c2:,} part-2 IDs in {elapsed * 1e6:,.0f} µs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("02"))
+    parser.add_argument("--check", type=int, metavar="TRIALS", help="validate against the regex scan")
+    parser.add_argument("--bench", action="store_true", help="time ranges up to 10^18")
+    args = parser.parse_args()
+
+    if args.check:
+        check(args.check)
+        return
+    if args.bench:
+        benchmark()
+        return
+
+    part1, part2 = solve(parse_ranges(args.input.read_text()))
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
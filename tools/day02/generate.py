@@ -0,0 +1,118 @@
+"""Enumerate Day 02 invalid IDs directly instead of scanning every integer.
+
+An ID of ``length`` digits made of a ``period``-digit pattern repeated is
+``pattern * repunit``, where the repunit is ``1`` followed by ``period - 1``
+zeros, repeated (``10101`` for period 2, length 6). Clamping ``pattern`` to the
+range gives every hit without touching the integers in between.
+
+An ID like ``111111`` repeats with periods 1, 2 and 3. Part 2 only generates it
+from its shortest period, by keeping patterns that are themselves not repeats
+(primitive), so no set is needed to deduplicate.
+
+    python -m tools.day02.generate [input]
+    python -m tools.day02.generate --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from tools.common import input_path
+from tools.day02.ids import Range, brute_force, parse_ranges
+from tools.intervals import IntervalSet
+
+
+def repunit(length: int, period: int) -> int:
+    """``10...010...01`` with ``length // period`` ones, ``period`` digits apart."""
+    return (10**length - 1) // (10**period - 1)
+
+
+def divisors(n: int) -> list[int]:
+    """Divisors of ``n`` below ``n``."""
+    return [d for d in range(1, n // 2 + 1) if n % d == 0]
+
+
+def is_primitive(pattern: int, period: int) -> bool:
+    """True if the ``period``-digit ``pattern`` is not itself a repeated block."""
+    for d in divisors(period):
+        if pattern == pattern // 10 ** (period - d) * repunit(period, d):
+            return False
+    return True
+
+
+def periods(length: int, part: int) -> list[int]:
+    """Pattern lengths that make an invalid ID of ``length`` digits."""
+    if part == 1:
+        return [length // 2] if length % 2 == 0 else []
+    return divisors(length)
+
+
+def _repeats(low: int, high: int, length: int, period: int, primitive_only: bool) -> Iterator[int]:
+    multiplier = repunit(length, period)
+    first = max(-(-low // multiplier), 10 ** (period - 1))
+    last = min(high // multiplier, 10**period - 1)
+    for pattern in range(first, last + 1):
+        if not primitive_only or is_primitive(pattern, period):
+            yield pattern * multiplier
+
+
+def invalid_ids(start: int, end: int, part: int) -> Iterator[int]:
+    """Yield the invalid IDs in ``start..end`` in increasing order."""
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        if low > high:
+            continue
+        yield from heapq.merge(*(
+            _repeats(low, high, length, period, primitive_only=part == 2)
+            for period in periods(length, part)
+        ))
+
+
+def solve(ranges: Iterable[Range]) -> tuple[int, int]:
+    """Return ``(part1, part2)``; overlapping ranges count an ID once."""
+    merged = IntervalSet.from_ranges(ranges)
+    part1 = sum(sum(invalid_ids(start, end, 1)) for start, end in merged)
+    part2 = sum(sum(invalid_ids(start, end, 2)) for start, end in merged)
+    return part1, part2
+
+
+def benchmark(ranges: list[Range]) -> None:
+    started = time.perf_counter()
+    expected = brute_force(ranges)
+    scan = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = solve(ranges)
+    generated = time.perf_counter() - started
+
+    if actual != expected:
+        raise AssertionError(f"generator {actual} != brute force {expected}")
+    width = sum(end - start + 1 for start, end in ranges)
+    print(f"ranges: {len(ranges)}, integers covered: {width:,}")
+    print(f"regex scan: {scan:.3f} s")
+    print(f"generator:  {generated * 1e3:.3f} ms ({scan / generated:,.0f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("02"))
+    parser.add_argument("--bench", action="store_true", help="compare with the regex scan")
+    args = parser.parse_args()
+
+    ranges = parse_ranges(args.input.read_text())
+    if args.bench:
+        benchmark(ranges)
+        return
+
+    part1, part2 = solve(ranges)
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Reference Day 02 logic.
+
+`brute_force` follows human-solutions/02/python/main.py: every integer of every
+range is checked against the two backreference patterns, and IDs are counted
+once even if ranges overlap. The faster engines in this package are checked
+against it.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+pattern1 = re.compile(r"^(\d+)\1$")
+pattern2 = re.compile(r"^(\d+)\1+$")
+
+Range = tuple[int, int]
+
+
+def parse_ranges(text: str) -> list[Range]:
+    """Parse ``11-22,95-115,...`` (newlines and blank entries are ignored)."""
+    ranges = []
+    for entry in text.replace("\n", "").split(","):
+        if entry.strip():
+            start_str, end_str = entry.split("-")
+            ranges.append((int(start_str), int(end_str)))
+    return ranges
+
+
+def is_invalid_part1(n: int) -> bool:
+    return pattern1.match(str(n)) is not None
+
+
+def is_invalid_part2(n: int) -> bool:
+    return pattern2.match(str(n)) is not None
+
+
+def brute_force(ranges: Iterable[Range]) -> tuple[int, int]:
+    """Return ``(part1, part2)`` sums by scanning every integer."""
+    invalid_ids = set()
+    invalid_ids2 = set()
+    for start, end in ranges:
+        for i in range(start, end + 1):
+            s = str(i)
+            if pattern1.match(s):
+                invalid_ids.add(i)
+            if pattern2.match(s):
+                invalid_ids2.add(i)
+    return sum(invalid_ids), sum(invalid_ids2)
+
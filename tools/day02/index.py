@@ -0,0 +1,118 @@
+"""Persistent prefix-sum index of Day 02 invalid IDs.
+
+``build`` writes every invalid ID up to a bound, sorted, for both parts, along
+with running sums. ``query`` memory-maps the file and answers each range with
+two binary searches: the count is the distance between them and the sum is
+the difference of the running sums.
+
+Layout (little endian): a 32-byte header (magic ``IDIX``, version, bound,
+part-1 count, part-2 count) followed, for part 1 then part 2, by the sorted IDs
+and the ``count + 1`` running sums, all uint64.
+
+    python -m tools.day02.index build --bound 1000000000000 ids.idx
+    python -m tools.day02.index query ids.idx [input]
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from tools.common import input_path
+from tools.day02.closed_form import range_totals
+from tools.day02.generate import invalid_ids
+from tools.day02.ids import Range, parse_ranges
+from tools.intervals import IntervalSet
+
+MAGIC = b"IDIX"
+VERSION = 1
+HEADER = struct.Struct("<4sBxxxQQQ")
+
+
+def build(path: Path, bound: int) -> None:
+    """Write the index of all invalid IDs in ``1..bound``."""
+    sections = []
+    for part in (1, 2):
+        count, total = range_totals(1, bound, part)
+        if total >= 2**64:
+            raise ValueError(f"part {part} sums up to {bound} overflow uint64; use a smaller bound")
+        ids = np.fromiter(invalid_ids(1, bound, part), dtype=np.uint64, count=count)
+        sums = np.zeros(count + 1, dtype=np.uint64)
+        np.cumsum(ids, out=sums[1:])
+        sections.append((ids, sums))
+
+    with path.open("wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, bound, sections[0][0].size, sections[1][0].size))
+        for ids, sums in sections:
+            file.write(ids.astype("<u8").tobytes())
+            file.write(sums.astype("<u8").tobytes())
+
+
+class InvalidIdIndex:
+    """Memory-mapped index answering ``(count, sum)`` per range in O(log n)."""
+
+    def __init__(self, path: Path) -> None:
+        mapped = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, self.bound, count1, count2 = HEADER.unpack(mapped[: HEADER.size].tobytes())
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} invalid-ID index")
+
+        words = mapped[HEADER.size:].view("<u8")
+        self._parts = {}
+        offset = 0
+        for part, count in ((1, count1), (2, count2)):
+            ids = words[offset:offset + count]
+            sums = words[offset + count:offset + 2 * count + 1]
+            self._parts[part] = (ids, sums)
+            offset += 2 * count + 1
+
+    def query(self, start: int, end: int, part: int) -> tuple[int, int]:
+        """Return ``(count, sum)`` of the invalid IDs in ``start..end``."""
+        if end > self.bound:
+            raise ValueError(f"range end {end} is past the index bound {self.bound}")
+        if start > end:
+            return 0, 0
+        ids, sums = self._parts[part]
+        low = int(np.searchsorted(ids, np.uint64(max(start, 0)), side="left"))
+        high = int(np.searchsorted(ids, np.uint64(end), side="right"))
+        return high - low, int(sums[high]) - int(sums[low])
+
+    def solve(self, ranges: Iterable[Range]) -> tuple[int, int]:
+        """Return ``(part1, part2)``; overlapping ranges count an ID once."""
+        merged = IntervalSet.from_ranges(ranges)
+        part1 = sum(self.query(start, end, 1)[1] for start, end in merged)
+        part2 = sum(self.query(start, end, 2)[1] for start, end in merged)
+        return part1, part2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="write an index of invalid IDs up to a bound")
+    build_parser.add_argument("--bound", type=int, default=10**12)
+    build_parser.add_argument("path", type=Path)
+
+    query_parser = commands.add_parser("query", help="solve a range list with an index")
+    query_parser.add_argument("path", type=Path)
+    query_parser.add_argument("input", nargs="?", type=Path, default=input_path("02"))
+
+    args = parser.parse_args()
+    if args.command == "build":
+        started = time.perf_counter()
+        build(args.path, args.bound)
+        print(f"wrote {args.path} ({args.path.stat().st_size:,} bytes) in {time.perf_counter() - started:.2f} s")
+        return
+
+    part1, part2 = InvalidIdIndex(args.path).solve(parse_ranges(args.input.read_text()))
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
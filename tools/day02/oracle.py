@@ -0,0 +1,123 @@
+"""Process-pool brute-force oracle for Day 02.
+
+Every integer is still checked, by default one by one with
+``is_double_repeated`` and ``is_repeated_pattern`` from ai-solutions/02/opus-4.5,
+so this stays the reference the clever engines are validated against. The
+input ranges are merged first (an ID is counted once), then cut into shards of
+equal width so the widest ranges no longer dominate, and the shards run in a
+process pool.
+
+``--checker composer`` uses the string checkers of composer-1 instead, and
+``--checker numpy`` the vectorized checker from `tools.day02.vector_check`.
+
+    python -m tools.day02.oracle [input] [--workers N] [--shards M] [--checker numpy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from pathlib import Path
+from types import ModuleType
+
+from tools.common import input_path, load_solution
+from tools.day02.ids import Range, parse_ranges
+from tools.day02.vector_check import scan_range, string_invalid_part1, string_invalid_part2
+from tools.intervals import IntervalSet
+
+SHARDS_PER_WORKER = 4
+CHECKERS = ("opus", "composer", "numpy")
+
+
+@cache
+def _opus() -> ModuleType:
+    return load_solution("ai-solutions/02/opus-4.5/python/main.py")
+
+
+def shard_ranges(ranges: list[Range], shards: int) -> list[list[Range]]:
+    """Merge ``ranges`` and cut them into ``shards`` pieces of equal total width."""
+    merged = IntervalSet.from_ranges(ranges)
+    total = merged.size()
+    width = max(-(-total // shards), 1)
+
+    result: list[list[Range]] = [[]]
+    room = width
+    for start, end in merged:
+        while start <= end:
+            if not room:
+                result.append([])
+                room = width
+            stop = min(end, start + room - 1)
+            result[-1].append((start, stop))
+            room -= stop - start + 1
+            start = stop + 1
+    return [shard for shard in result if shard]
+
+
+def scan_shard(shard: list[Range], checker: str = "opus") -> tuple[int, int, float]:
+    """Brute-force one shard; returns ``(part1, part2, seconds)``."""
+    started = time.perf_counter()
+    part1 = part2 = 0
+
+    if checker == "numpy":
+        for start, end in shard:
+            sum1, sum2 = scan_range(start, end)
+            part1 += sum1
+            part2 += sum2
+        return part1, part2, time.perf_counter() - started
+
+    if checker == "composer":
+        is_double_repeated, is_repeated_pattern = string_invalid_part1, string_invalid_part2
+    else:
+        opus = _opus()
+        is_double_repeated, is_repeated_pattern = opus.is_double_repeated, opus.is_repeated_pattern
+    for start, end in shard:
+        for num in range(start, end + 1):
+            if is_double_repeated(num):
+                part1 += num
+            if is_repeated_pattern(num):
+                part2 += num
+    return part1, part2, time.perf_counter() - started
+
+
+def solve(ranges: list[Range], workers: int | None = None, shards: int | None = None,
+          checker: str = "opus", report: bool = False) -> tuple[int, int]:
+    """Return ``(part1, part2)`` by scanning every integer in parallel."""
+    workers = workers or os.cpu_count() or 1
+    sharded = shard_ranges(ranges, shards or workers * SHARDS_PER_WORKER)
+    with ProcessPoolExecutor(workers) as pool:
+        results = list(pool.map(partial(scan_shard, checker=checker), sharded))
+
+    if report:
+        print(f"{'shard':>6}{'integers':>14}{'seconds':>10}", file=sys.stderr)
+        for number, (shard, (_, _, elapsed)) in enumerate(zip(sharded, results)):
+            width = sum(end - start + 1 for start, end in shard)
+            print(f"{number:>6}{width:>14,}{elapsed:>10.3f}", file=sys.stderr)
+
+    return sum(r[0] for r in results), sum(r[1] for r in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("02"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shards", type=int, default=None)
+    parser.add_argument("--checker", choices=CHECKERS, default="opus")
+    parser.add_argument("--report", action="store_true", help="print per-shard timings to stderr")
+    args = parser.parse_args()
+
+    ranges = parse_ranges(args.input.read_text())
+    started = time.perf_counter()
+    part1, part2 = solve(ranges, args.workers, args.shards, args.checker, args.report)
+    print(part1)
+    print(part2)
+    if args.report:
+        print(f"wall time: {time.perf_counter() - started:.3f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
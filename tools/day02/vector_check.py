@@ -0,0 +1,137 @@
+"""NumPy repeated-digit checker for scanning Day 02 ranges.
+
+Integers are processed in int64 blocks and bucketed by digit length. For each
+period that divides the length, the number is peeled into period-sized chunks
+with ``divmod`` by a power of ten and every chunk is compared with the lowest
+one, so no integer is ever turned into a string.
+
+`string_invalid_part1` / `string_invalid_part2` are the string-based checkers
+of ai-solutions/02/composer-1 (that solution runs on import, so they are
+reproduced here); the oracle selects between them and this module with
+``--checker``.
+
+    python -m tools.day02.vector_check --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from tools.day02.generate import divisors
+
+BLOCK = 1 << 20
+POWERS = np.array([10**i for i in range(19)], dtype=np.int64)
+
+
+def string_invalid_part1(num: int) -> bool:
+    str_num = str(num)
+    length = len(str_num)
+    if length % 2 != 0:
+        return False
+    half_len = length // 2
+    return str_num[:half_len] == str_num[half_len:]
+
+
+def string_invalid_part2(num: int) -> bool:
+    str_num = str(num)
+    length = len(str_num)
+    for pattern_len in range(1, length // 2 + 1):
+        if length % pattern_len != 0:
+            continue
+
+        repetitions = length // pattern_len
+        if repetitions < 2:
+            continue
+
+        pattern = str_num[:pattern_len]
+        is_valid_pattern = True
+
+        for i in range(1, repetitions):
+            segment = str_num[i * pattern_len:(i + 1) * pattern_len]
+            if segment != pattern:
+                is_valid_pattern = False
+                break
+
+        if is_valid_pattern:
+            return True
+
+    return False
+
+
+def _repeats(values: np.ndarray, length: int, period: int) -> np.ndarray:
+    """Mask of ``length``-digit values made of one ``period``-digit chunk repeated."""
+    power = POWERS[period]
+    rest, first = np.divmod(values, power)
+    mask = np.ones(values.size, dtype=bool)
+    for _ in range(length // period - 1):
+        rest, chunk = np.divmod(rest, power)
+        mask &= chunk == first
+    return mask
+
+
+def invalid_masks(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(part1, part2)`` masks for an array of non-negative int64 values."""
+    values = np.asarray(values, dtype=np.int64)
+    lengths = np.searchsorted(POWERS, values, side="right")
+    part1 = np.zeros(values.size, dtype=bool)
+    part2 = np.zeros(values.size, dtype=bool)
+
+    for length in np.unique(lengths).tolist():
+        rows = np.flatnonzero(lengths == length)
+        bucket = values[rows]
+        hits2 = np.zeros(rows.size, dtype=bool)
+        for period in divisors(length):
+            hits = _repeats(bucket, length, period)
+            hits2 |= hits
+            if 2 * period == length:
+                part1[rows] = hits
+        part2[rows] = hits2
+    return part1, part2
+
+
+def scan_range(start: int, end: int) -> tuple[int, int]:
+    """Return the part-1 and part-2 sums of ``start..end`` by checking every integer."""
+    part1 = part2 = 0
+    for low in range(start, end + 1, BLOCK):
+        block = np.arange(low, min(low + BLOCK, end + 1), dtype=np.int64)
+        mask1, mask2 = invalid_masks(block)
+        part1 += sum(block[mask1].tolist())
+        part2 += sum(block[mask2].tolist())
+    return part1, part2
+
+
+def benchmark(width: int) -> None:
+    print(f"{'digits':>6}{'string (ns/int)':>18}{'numpy (ns/int)':>16}{'speedup':>10}")
+    for digits in (4, 6, 8, 10, 12, 15, 18):
+        start = 10 ** (digits - 1)
+        end = start + width - 1
+        began = time.perf_counter()
+        expected = (
+            sum(n for n in range(start, end + 1) if string_invalid_part1(n)),
+            sum(n for n in range(start, end + 1) if string_invalid_part2(n)),
+        )
+        string = time.perf_counter() - began
+        began = time.perf_counter()
+        actual = scan_range(start, end)
+        vector = time.perf_counter() - began
+        if actual != expected:
+            raise AssertionError(f"{digits} digits: numpy {actual} != string {expected}")
+        print(f"{digits:>6}{string / width * 1e9:>18.0f}{vector / width * 1e9:>16.0f}{string / vector:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bench", action="store_true", help="compare with the string checkers")
+    parser.add_argument("--width", type=int, default=200_000, help="integers per digit length")
+    args = parser.parse_args()
+    if args.bench:
+        benchmark(args.width)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
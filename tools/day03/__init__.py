@@ -0,0 +1 @@
+"""Day 03 (Lobby) battery-bank selection engines."""
@@ -0,0 +1,163 @@
+"""Best joltage of a bank for every k from 1 to its length, in one pass.
+
+Dropping one digit to get the largest number means dropping the first digit
+that is smaller than its right neighbour, or the last digit if there is none;
+repeating that single step from the full bank gives the best selection for
+every smaller count. The selections are therefore nested, and the order in
+which digits are dropped describes all of them. That order is exactly the pop
+order of the monotonic stack of `max_subsequence_number`
+(ai-solutions/03/gpt-5.1-codex), followed by the leftover stack from the top.
+
+A `JoltageProfile` keeps the digits and, per digit, the smallest ``k`` whose
+selection contains it: two arrays of n entries instead of n big integers,
+built in O(n). ``best_digits(k)`` is ``digits[min_k <= k]``.
+
+    python -m tools.day03.all_k [input]           # k and total over all banks
+    python -m tools.day03.all_k --check 300
+    python -m tools.day03.all_k --bench 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from tools.common import input_path, load_solution
+from tools.day03.joltage import getBiggestLeftToRight, parse_banks, random_banks
+
+ZERO = ord("0")
+
+
+class JoltageProfile:
+    """All best-k selections of one bank."""
+
+    def __init__(self, row: str | bytes) -> None:
+        data = row.encode() if isinstance(row, str) else bytes(row)
+        size = len(data)
+        min_k = np.empty(size, dtype=np.int32)
+        stack: list[int] = []
+        dropped = 0
+        for index, digit in enumerate(data):
+            while stack and data[stack[-1]] < digit:
+                min_k[stack.pop()] = size - dropped
+                dropped += 1
+            stack.append(index)
+        for index in reversed(stack):
+            min_k[index] = size - dropped
+            dropped += 1
+
+        self.digits = np.frombuffer(data, dtype=np.uint8) - ZERO
+        self.min_k = min_k
+
+    def __len__(self) -> int:
+        return self.digits.size
+
+    def best_digits(self, k: int) -> np.ndarray:
+        """Digits (0-9) of the best ``k``-digit joltage."""
+        if not 1 <= k <= self.digits.size:
+            raise ValueError(f"cannot pick {k} digits from a bank of {self.digits.size}")
+        return self.digits[self.min_k <= k]
+
+    def best(self, k: int) -> int:
+        return int((self.best_digits(k) + ZERO).tobytes())
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Digit arrays for ``k = 1, 2, ..., len(self)``."""
+        for k in range(1, self.digits.size + 1):
+            yield self.best_digits(k)
+
+    def place_sums(self, ks: np.ndarray) -> np.ndarray:
+        """``(len(ks), len(self))`` table: digit sum at each power of ten, per ``k``."""
+        invalid = ks[(ks < 1) | (ks > self.digits.size)]
+        if invalid.size:
+            raise ValueError(f"cannot pick {invalid[0]} digits from a bank of {self.digits.size}")
+        member = self.min_k[None, :] <= ks[:, None]
+        power = np.cumsum(member[:, ::-1], axis=1)[:, ::-1] - 1
+        rows = np.broadcast_to(np.arange(ks.size)[:, None], member.shape)
+        weights = np.where(member, self.digits, 0)
+        flat = (rows * self.digits.size + np.maximum(power, 0)).ravel()
+        return np.bincount(flat, weights.ravel(), minlength=member.size).astype(np.int64).reshape(member.shape)
+
+
+def totals(banks: Iterable[str], ks: Iterable[int]) -> list[int]:
+    """Sum of the best ``k``-digit joltage over all banks, for each ``k``."""
+    ks = np.array(list(ks), dtype=np.int32)
+    sums: np.ndarray | None = None
+    for row in banks:
+        table = JoltageProfile(row).place_sums(ks)
+        if sums is None:
+            sums = np.zeros((ks.size, max(int(ks.max(initial=0)), 1)), dtype=np.int64)
+        sums += table[:, : sums.shape[1]]
+    if sums is None:
+        return [0] * ks.size
+    return [sum(value * 10**power for power, value in enumerate(row)) for row in sums.tolist()]
+
+
+def check(trials: int, seed: int = 2025) -> None:
+    """Compare with `max_subsequence_number` (k = 2, 12) and the human greedy (every k)."""
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    rng = random.Random(seed)
+    for _ in range(trials):
+        row = "".join(rng.choices(rng.choice(("0123456789", "89", "5", "123")), k=rng.randint(12, 60)))
+        profile = JoltageProfile(row)
+        for k in (2, 12):
+            if profile.best(k) != codex.max_subsequence_number(row, k):
+                raise AssertionError(f"{row} k={k}: {profile.best(k)} != max_subsequence_number")
+        for k, digits in enumerate(profile, start=1):
+            if int((digits + ZERO).tobytes()) != getBiggestLeftToRight(row, k):
+                raise AssertionError(f"{row} k={k}: profile != getBiggestLeftToRight")
+        ks = range(1, len(row) + 1)
+        if totals([row, row], ks) != [2 * getBiggestLeftToRight(row, k) for k in ks]:
+            raise AssertionError(f"{row}: totals disagree")
+    print(f"{trials} random rows match max_subsequence_number and getBiggestLeftToRight")
+
+
+def benchmark(length: int) -> None:
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    (row,) = random_banks(1, length)
+
+    started = time.perf_counter()
+    expected = [codex.max_subsequence_number(row, k) for k in range(1, length + 1)]
+    repeated = time.perf_counter() - started
+
+    started = time.perf_counter()
+    profile = JoltageProfile(row)
+    built = time.perf_counter() - started
+    actual = [profile.best(k) for k in range(1, length + 1)]
+    answered = time.perf_counter() - started
+
+    if actual != expected:
+        raise AssertionError("profile disagrees with max_subsequence_number")
+    print(f"one bank of {length:,} digits, every k")
+    print(f"max_subsequence_number x {length:,}: {repeated:.3f} s")
+    print(f"JoltageProfile build:             {built * 1e3:.3f} ms (2 arrays, {profile.digits.nbytes + profile.min_k.nbytes:,} bytes)")
+    print(f"JoltageProfile + every best(k):   {answered:.3f} s ({repeated / answered:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("03"))
+    parser.add_argument("--check", type=int, metavar="TRIALS", help="validate against the single-k functions")
+    parser.add_argument("--bench", type=int, metavar="LENGTH", help="time every k on one synthetic bank")
+    args = parser.parse_args()
+
+    if args.check:
+        check(args.check)
+        return
+    if args.bench:
+        benchmark(args.bench)
+        return
+
+    banks = parse_banks(args.input.read_text())
+    ks = range(1, min(map(len, banks), default=0) + 1)
+    for k, total in zip(ks, totals(banks, ks)):
+        print(f"{k}\t{total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Adversarial-input benchmark for the Day 03 selection algorithms.
+
+Selectors compared:
+
+- ``human``: `getBiggestLeftToRight`, an O(n * k) window rescan
+- ``sonnet-4.5``: `find_max_number`, the same rescan over the string (that
+  solution runs on import, so it is reproduced here)
+- ``gemini-3-pro``: `solve_line`, a rescan that stops a window at the first 9
+- ``gpt-5.1-codex``: `max_subsequence_number`, a monotonic stack, O(n)
+
+Rows are all-equal, sorted descending, sorted ascending (a bank cannot be
+strictly monotone past 10 digits, so these are non-increasing and
+non-decreasing runs), random, and random 0-8 with one 9 at the tail. Every
+selector is timed in-process with warmup and repeats and cross-checked against
+the stack. Rescans are skipped where a row would cost more than `SCAN_BUDGET`
+window steps. The output is a Markdown table in µs per row, with the fastest
+selector of each row.
+
+    python -m tools.day03.bench_selectors [--lengths 100 1000 10000] [--output table.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Callable
+
+from tools.common import best_time, load_solution
+from tools.day03.joltage import getBiggestLeftToRight
+
+SCAN_BUDGET = 5_000_000
+
+
+def find_max_number(digits, count):
+    """``find_max_number`` of ai-solutions/03/sonnet-4.5."""
+    n = len(digits)
+    if count > n:
+        return 0
+
+    # Greedy approach: select 'count' digits that form the largest number
+    result = []
+    start = 0
+
+    for i in range(count):
+        # We need to pick 'count - i' more digits from the remaining string
+        # So we can search up to index n - (count - i)
+        end = n - (count - i) + 1
+
+        # Find the maximum digit in the valid range
+        max_digit = digits[start]
+        max_pos = start
+
+        for j in range(start, end):
+            if digits[j] > max_digit:
+                max_digit = digits[j]
+                max_pos = j
+
+        result.append(max_digit)
+        start = max_pos + 1
+
+    return int(''.join(result))
+
+
+def selectors() -> dict[str, tuple[Callable[[str, int], int], bool]]:
+    """Name -> (selector, rescans windows)."""
+    gemini = load_solution("ai-solutions/03/gemini-3-pro/python/solution.py")
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    return {
+        "human": (getBiggestLeftToRight, True),
+        "sonnet-4.5": (find_max_number, True),
+        "gemini-3-pro": (gemini.solve_line, True),
+        "gpt-5.1-codex": (codex.max_subsequence_number, False),
+    }
+
+
+def rows(length: int, seed: int = 2025) -> dict[str, str]:
+    """Named adversarial banks of ``length`` digits."""
+    rng = random.Random(seed)
+    runs = sorted(rng.choices("0123456789", k=length))
+    return {
+        "all-equal": "5" * length,
+        "descending": "".join(reversed(runs)),
+        "ascending": "".join(runs),
+        "random": "".join(rng.choices("0123456789", k=length)),
+        "9 at tail": "".join(rng.choices("012345678", k=length - 1)) + "9",
+    }
+
+
+def run(lengths: list[int], repeat: int) -> str:
+    sys.set_int_max_str_digits(0)
+    named = selectors()
+    lines = [
+        "| row | n | k | " + " | ".join(named) + " | fastest |",
+        "|" + " --- | ---: | ---: |" + " ---: |" * len(named) + " --- |",
+    ]
+    for length in lengths:
+        for kind, row in rows(length).items():
+            for k in sorted({2, 12, length // 2}):
+                expected = named["gpt-5.1-codex"][0](row, k)
+                cells, timings = [], {}
+                for name, (select, rescans) in named.items():
+                    if rescans and k * (length - k + 1) > SCAN_BUDGET:
+                        cells.append("skipped (O(n·k))")
+                        continue
+                    if select(row, k) != expected:
+                        cells.append("MISMATCH")
+                        continue
+                    timings[name] = best_time(lambda: select(row, k), repeat) * 1e6
+                    cells.append(f"{timings[name]:,.1f}")
+                fastest = min(timings, key=timings.get)
+                lines.append(f"| {kind} | {length:,} | {k:,} | " + " | ".join(cells) + f" | {fastest} |")
+    return "µs per row\n\n" + "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="also write the table to this file")
+    args = parser.parse_args()
+
+    table = run(args.lengths, args.repeat)
+    print(table)
+    if args.output:
+        args.output.write_text(table)
+
+
+if __name__ == "__main__":
+    main()
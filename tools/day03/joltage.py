@@ -0,0 +1,59 @@
+"""Reference Day 03 logic.
+
+`getBiggestLeftToRight` is the selection of human-solutions/03/python/main.py,
+reproduced because that script runs on import: for each output digit it scans
+the window that still leaves room for the remaining digits and keeps the
+leftmost maximum. The faster engines in this package are checked against it.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterable
+
+KS = (2, 12)
+
+
+def getBiggestLeftToRight(row: str, numDigits: int) -> int:
+    result = []
+    startIndex = 0
+
+    for pos in range(numDigits):
+        digitsRemaining = numDigits - pos - 1
+        endIndex = len(row) - digitsRemaining
+
+        maxDigit = -1
+        maxIndex = -1
+
+        for i in range(startIndex, endIndex):
+            digit = int(row[i])
+            if digit > maxDigit:
+                maxDigit = digit
+                maxIndex = i
+
+        result.append(str(maxDigit))
+        startIndex = maxIndex + 1
+
+    return int(''.join(result))
+
+
+def parse_banks(text: str) -> list[str]:
+    """One digit string per non-empty line."""
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def solve(banks: Iterable[str], ks: Iterable[int] = KS) -> list[int]:
+    """Sum of the best ``k``-digit joltage over all banks, for each ``k``."""
+    ks = list(ks)
+    totals = [0] * len(ks)
+    for row in banks:
+        for i, k in enumerate(ks):
+            totals[i] += getBiggestLeftToRight(row, k)
+    return totals
+
+
+def random_banks(count: int, length: int = 100, seed: int = 2025) -> list[str]:
+    """Synthetic banks shaped like ``inputs/03.txt``."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.digits, k=length)) for _ in range(count)]
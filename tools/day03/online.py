@@ -0,0 +1,139 @@
+"""Online Day 03 bank that accepts appended digits.
+
+A `Bank` tracks a fixed set of ``k`` values with one streaming
+`tools.day03.stream.BankSelector` each. Appending digits costs amortized O(1)
+per digit and ``k``, since every digit is pushed and popped at most once. A query
+replays the at most ``k`` digits of the selector's delay line on a copy of
+its stack, O(k), and is cached until the next append. Nothing is ever
+rescanned, and only O(k) bytes are kept per ``k``, not the bank itself.
+
+    python -m tools.day03.online --check 300
+    python -m tools.day03.online --bench 500 --chunk 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Iterable
+
+from tools.common import load_solution
+from tools.day03.joltage import KS, getBiggestLeftToRight
+from tools.day03.stream import BankSelector
+
+
+class Bank:
+    """A growing bank with its best ``k``-digit joltage for each tracked ``k``."""
+
+    def __init__(self, ks: Iterable[int] = KS, digits: str | bytes = b"") -> None:
+        self._selectors = {k: BankSelector(k) for k in ks}
+        self._cache: dict[int, bytes] = {}
+        self._length = 0
+        if digits:
+            self.append(digits)
+
+    @property
+    def ks(self) -> list[int]:
+        return list(self._selectors)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, digits: str | bytes) -> None:
+        data = digits.encode() if isinstance(digits, str) else bytes(digits)
+        if not data:
+            return
+        if not data.isdigit():
+            raise ValueError(f"not a digit string: {data[:20]!r}")
+        for selector in self._selectors.values():
+            selector.feed(data)
+        self._length += len(data)
+        self._cache.clear()
+
+    def best_digits(self, k: int) -> bytes:
+        """The current best ``k`` digits, as ASCII."""
+        if k not in self._selectors:
+            raise ValueError(f"k={k} is not tracked (tracked: {self.ks})")
+        if k not in self._cache:
+            self._cache[k] = self._selectors[k].current()
+        return self._cache[k]
+
+    def best(self, k: int) -> int:
+        return int(self.best_digits(k))
+
+
+def check(trials: int, seed: int = 2025) -> None:
+    """Compare every answer after every append with a fresh recomputation."""
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    rng = random.Random(seed)
+    queries = 0
+    for _ in range(trials):
+        ks = sorted(rng.sample(range(1, 16), rng.randint(1, 4)))
+        alphabet = rng.choice(("0123456789", "89", "5", "9876543210", "0123"))
+        bank = Bank(ks)
+        row = ""
+        for _ in range(rng.randint(1, 25)):
+            digits = "".join(rng.choices(alphabet, k=rng.randint(0, 8)))
+            bank.append(digits)
+            row += digits
+            for k in ks:
+                if len(row) < k:
+                    continue
+                expected = getBiggestLeftToRight(row, k)
+                if bank.best(k) != expected or codex.max_subsequence_number(row, k) != expected:
+                    raise AssertionError(f"{row} k={k}: bank {bank.best(k)} != recomputed {expected}")
+                queries += 1
+    print(f"{trials} random banks, {queries:,} queries match a fresh recomputation")
+
+
+def benchmark(appends: int, chunk: int, seed: int = 2025) -> None:
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    rng = random.Random(seed)
+    pieces = ["".join(rng.choices("0123456789", k=chunk)) for _ in range(appends)]
+
+    modes = {
+        "getBiggestLeftToRight": getBiggestLeftToRight,
+        "max_subsequence_number": codex.max_subsequence_number,
+    }
+    print(f"{appends:,} appends of {chunk} digits (final bank {appends * chunk:,} digits), k = {KS}")
+
+    started = time.perf_counter()
+    bank = Bank(KS)
+    online = []
+    for piece in pieces:
+        bank.append(piece)
+        online.append([bank.best(k) for k in KS if k <= len(bank)])
+    incremental = time.perf_counter() - started
+    print(f"{'Bank.append + best':<32}{incremental:>8.3f} s")
+
+    for name, select in modes.items():
+        started = time.perf_counter()
+        row = ""
+        answers = []
+        for piece in pieces:
+            row += piece
+            answers.append([select(row, k) for k in KS if k <= len(row)])
+        elapsed = time.perf_counter() - started
+        if answers != online:
+            raise AssertionError(f"Bank disagrees with {name}")
+        print(f"{'recompute ' + name:<32}{elapsed:>8.3f} s ({elapsed / incremental:,.0f}x slower)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", type=int, metavar="TRIALS", help="validate against fresh recomputation")
+    parser.add_argument("--bench", type=int, metavar="APPENDS", help="time appends against full recomputation")
+    parser.add_argument("--chunk", type=int, default=10, help="digits per append in --bench")
+    args = parser.parse_args()
+
+    if args.check:
+        check(args.check)
+    elif args.bench:
+        benchmark(args.bench, args.chunk)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Multi-core Day 03 runner for very large bank files.
+
+The file is cut into line-aligned byte ranges without being read up front.
+Each worker process reads its own range and returns, for every requested
+``k``, the sum of its banks' best joltages; the parent adds the partial sums.
+Banks are independent, so no ordering or carry-over is needed.
+
+``--selector stack`` uses `max_subsequence_number` (ai-solutions/03/gpt-5.1-codex),
+``--selector scan`` the window rescan `getBiggestLeftToRight`.
+
+    python -m tools.day03.parallel [input] [--workers N] [--selector scan] [--ks 2 12]
+    python -m tools.day03.parallel --bench 50000 [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, reduce
+from pathlib import Path
+from typing import Callable
+
+from tools.common import input_path, line_aligned_shards, load_solution, read_range
+from tools.day03 import joltage
+from tools.day03.joltage import KS, getBiggestLeftToRight
+
+CHUNKS_PER_WORKER = 4
+SELECTORS = ("stack", "scan")
+
+
+@cache
+def _selector(name: str) -> Callable[[str, int], int]:
+    if name == "scan":
+        return getBiggestLeftToRight
+    return load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py").max_subsequence_number
+
+
+def _sum_range(task: tuple[Path, int, int, tuple[int, ...], str]) -> list[int]:
+    path, start, end, ks, selector = task
+    select = _selector(selector)
+    totals = [0] * len(ks)
+    for line in read_range(path, start, end).decode().splitlines():
+        row = line.strip()
+        if row:
+            for i, k in enumerate(ks):
+                totals[i] += select(row, k)
+    return totals
+
+
+def _add(totals: list[int], partial: list[int]) -> list[int]:
+    return [a + b for a, b in zip(totals, partial)]
+
+
+def solve_parallel(path: Path, ks: tuple[int, ...] = KS, workers: int | None = None,
+                   selector: str = "stack", in_process: bool = True) -> list[int]:
+    """Sum of the best ``k``-digit joltage over all banks, for each ``k``.
+
+    One worker runs in this process unless ``in_process`` is false.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(path, start, end, ks, selector) for start, end in line_aligned_shards(path, workers * CHUNKS_PER_WORKER)]
+    if workers == 1 and in_process:
+        return reduce(_add, map(_sum_range, tasks), [0] * len(ks))
+    with ProcessPoolExecutor(workers) as pool:
+        return reduce(_add, pool.map(_sum_range, tasks), [0] * len(ks))
+
+
+def benchmark(rows: int, selector: str, max_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "03.txt"
+        path.write_text("\n".join(joltage.random_banks(rows)) + "\n")
+        megabytes = path.stat().st_size / 1e6
+        print(f"banks: {rows:,} ({megabytes:.1f} MB), selector: {selector}, cpus: {os.cpu_count()}")
+
+        # The serial scan only checks correctness. Every row, one worker included, runs
+        # through a process pool, so pool start-up is part of the baseline too.
+        expected = joltage.solve(joltage.parse_banks(path.read_text()))
+        print(f"{'mode':<12}{'time (s)':>10}{'MB/s':>10}{'speedup':>10}")
+
+        baseline = None
+        workers = 1
+        while True:
+            started = time.perf_counter()
+            actual = solve_parallel(path, KS, workers, selector, in_process=False)
+            elapsed = time.perf_counter() - started
+            if actual != expected:
+                raise AssertionError(f"{workers} workers: {actual} != serial {expected}")
+            baseline = baseline or elapsed
+            print(f"{f'{workers} workers':<12}{elapsed:>10.3f}{megabytes / elapsed:>10.2f}{baseline / elapsed:>9.1f}x")
+            if workers >= max_workers:
+                break
+            workers = min(workers * 2, max_workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("03"))
+    parser.add_argument("--ks", type=int, nargs="+", default=list(KS), help="digits to select")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--selector", choices=SELECTORS, default="stack")
+    parser.add_argument("--bench", type=int, metavar="BANKS", help="time 1..N workers (N = --workers or the CPU count) against 1 worker")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.selector, args.workers or os.cpu_count() or 1)
+        return
+
+    for total in solve_parallel(args.input, tuple(args.ks), args.workers, args.selector):
+        print(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Sparse-table engine answering Day 03 for many k values per bank.
+
+The greedy selection picks, for each output digit, the leftmost maximum of a
+window ``[start, len(row) - remaining)``. `getBiggestLeftToRight` rescans that
+window every time, costing O(n * k) per row and per k. Here each row gets a
+sparse table once: level ``j`` holds the leftmost-max position of every window
+of ``2**j`` digits, built in O(n log n) with NumPy. Any window is then covered
+by two overlapping power-of-two windows, so each output digit is an O(1)
+lookup and a best ``k``-digit joltage costs O(k), for as many ``k`` as needed.
+
+    python -m tools.day03.sparse_table [input] [--ks 2 12]
+    python -m tools.day03.sparse_table --check 500
+    python -m tools.day03.sparse_table --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from tools.common import input_path
+from tools.day03.joltage import KS, getBiggestLeftToRight, parse_banks, random_banks
+
+ZERO = ord("0")
+
+
+class SparseTable:
+    """Leftmost range-maximum positions of one bank."""
+
+    def __init__(self, row: str | bytes) -> None:
+        data = row.encode() if isinstance(row, str) else bytes(row)
+        digits = np.frombuffer(data, dtype=np.uint8)
+        size = digits.size
+        levels = [np.arange(size, dtype=np.int32)]
+        width = 2
+        while width <= size:
+            previous = levels[-1]
+            left = previous[: size - width + 1]
+            right = previous[width // 2 : width // 2 + left.size]
+            # Ties keep the left position, so the leftmost maximum wins.
+            levels.append(np.where(digits[right] > digits[left], right, left))
+            width *= 2
+
+        self.row = data
+        self._levels = [memoryview(level) for level in levels]
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    def argmax(self, start: int, stop: int) -> int:
+        """Position of the leftmost largest digit in ``row[start:stop]``."""
+        level = (stop - start).bit_length() - 1
+        positions = self._levels[level]
+        left = positions[start]
+        right = positions[stop - (1 << level)]
+        return right if self.row[right] > self.row[left] else left
+
+    def best_digits(self, k: int) -> bytes:
+        """The largest ``k`` digits keeping their order, as ASCII."""
+        size = len(self.row)
+        if not 1 <= k <= size:
+            raise ValueError(f"cannot pick {k} digits from a bank of {size}")
+        row = self.row
+        picked = bytearray(k)
+        start = 0
+        for pos in range(k):
+            index = self.argmax(start, size - k + pos + 1)
+            picked[pos] = row[index]
+            start = index + 1
+        return bytes(picked)
+
+    def best(self, k: int) -> int:
+        return int(self.best_digits(k))
+
+    def best_many(self, ks: Iterable[int]) -> list[int]:
+        """Best joltage for each ``k``, from the same table."""
+        return [self.best(k) for k in ks]
+
+
+def solve(banks: Iterable[str], ks: Iterable[int] = KS) -> list[int]:
+    """Sum of the best ``k``-digit joltage over all banks, for each ``k``."""
+    ks = list(ks)
+    totals = [0] * len(ks)
+    for row in banks:
+        for i, value in enumerate(SparseTable(row).best_many(ks)):
+            totals[i] += value
+    return totals
+
+
+def check(trials: int, seed: int = 2025) -> None:
+    """Compare with `getBiggestLeftToRight` on random rows and every k."""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        row = "".join(rng.choices(rng.choice(("0123456789", "89", "5")), k=rng.randint(1, 80)))
+        table = SparseTable(row)
+        for k in range(1, len(row) + 1):
+            expected = getBiggestLeftToRight(row, k)
+            if table.best(k) != expected:
+                raise AssertionError(f"{row} k={k}: {table.best(k)} != {expected}")
+    print(f"{trials} random rows match getBiggestLeftToRight for every k")
+
+
+def benchmark(rows: int, length: int, count: int) -> None:
+    banks = random_banks(rows, length)
+    ks = sorted({max(1, length * i // count) for i in range(1, count + 1)})
+
+    started = time.perf_counter()
+    expected = [[getBiggestLeftToRight(row, k) for k in ks] for row in banks]
+    rescan = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = [SparseTable(row).best_many(ks) for row in banks]
+    table = time.perf_counter() - started
+
+    if actual != expected:
+        raise AssertionError("sparse table disagrees with getBiggestLeftToRight")
+    print(f"{rows} banks of {length} digits, {len(ks)} k values from {ks[0]} to {ks[-1]}")
+    print(f"getBiggestLeftToRight: {rescan:.3f} s")
+    print(f"sparse table:          {table:.3f} s ({rescan / table:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("03"))
+    parser.add_argument("--ks", type=int, nargs="+", default=list(KS), help="digits to select")
+    parser.add_argument("--check", type=int, metavar="TRIALS", help="validate against the rescanning greedy")
+    parser.add_argument("--bench", action="store_true", help="time many k values per bank")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--length", type=int, default=1000)
+    parser.add_argument("--count", type=int, default=50, help="k values per bank in --bench")
+    args = parser.parse_args()
+
+    if args.check:
+        check(args.check)
+        return
+    if args.bench:
+        benchmark(args.rows, args.length, args.count)
+        return
+
+    for total in solve(parse_banks(args.input.read_text()), args.ks):
+        print(total)
+
+
+if __name__ == "__main__":
+    main()
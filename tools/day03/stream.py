@@ -0,0 +1,235 @@
+"""Streaming Day 03 solver for banks with millions of digits.
+
+A bank is fed in chunks and never held whole. Each requested ``k`` keeps the
+monotonic stack of `max_subsequence_number` (ai-solutions/03/gpt-5.1-codex)
+in a ``bytearray``, with two changes that bound it to O(k) bytes:
+
+- The bank length is unknown until its newline, so the last ``k`` digits wait
+  in a delay line. A digit that leaves the delay line has ``k`` digits after
+  it, so it may pop freely. The delay line is replayed with the length check
+  once the bank ends.
+- Stack entries never move, and only the ``k`` lowest ones are kept in the
+  end, so a digit that would land above position ``k`` is dropped at once.
+
+Selections come out as ASCII digit strings. The cross-bank sum is kept in
+base-10**9 limbs, so no big integer is built unless asked for.
+
+    python -m tools.day03.stream [input | -] [--ks 2 12] [--emit]
+    python -m tools.day03.stream --bench 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable
+
+from tools.common import input_path, load_solution
+from tools.day03.joltage import KS, random_banks
+
+CHUNK_SIZE = 1 << 20
+LIMB = 10**9
+
+
+class BankSelector:
+    """Best ``k`` digits of one bank fed in pieces."""
+
+    def __init__(self, k: int) -> None:
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        self.k = k
+        self.count = 0
+        self._stack = bytearray()
+        self._pending = bytearray()
+
+    def feed(self, digits: bytes) -> None:
+        """Add ASCII digits to the current bank."""
+        self.count += len(digits)
+        pending = self._pending
+        pending += digits
+        cut = len(pending) - self.k
+        if cut <= 0:
+            return
+        released = pending[:cut]
+        # Deleting from the front of a bytearray is amortized O(1) in CPython.
+        del pending[:cut]
+
+        stack, k = self._stack, self.k
+        for digit in released:
+            while stack and stack[-1] < digit:
+                stack.pop()
+            if len(stack) < k:
+                stack.append(digit)
+
+    def current(self) -> bytes:
+        """The selection of the digits fed so far, without ending the bank."""
+        if self.count < self.k:
+            raise ValueError(f"cannot pick {self.k} digits from a bank of {self.count}")
+        stack, k = self._stack.copy(), self.k
+        remaining = len(self._pending)
+        for digit in self._pending:
+            while stack and stack[-1] < digit and len(stack) - 1 + remaining >= k:
+                stack.pop()
+            if len(stack) < k:
+                stack.append(digit)
+            remaining -= 1
+        return bytes(stack)
+
+    def finish(self) -> bytes:
+        """Return the selection of the bank fed so far and start a new one."""
+        selected = self.current()
+        self.count = 0
+        self._stack = bytearray()
+        self._pending = bytearray()
+        return selected
+
+
+class DecimalSum:
+    """Sum of decimal digit strings, kept as little-endian base-10**9 limbs."""
+
+    def __init__(self) -> None:
+        self.limbs: list[int] = []
+
+    def add(self, digits: bytes) -> None:
+        limbs = self.limbs
+        carry = 0
+        position = 0
+        for stop in range(len(digits), 0, -9):
+            value = int(digits[max(stop - 9, 0) : stop]) + carry
+            if position < len(limbs):
+                value += limbs[position]
+                limbs[position] = value % LIMB
+            else:
+                limbs.append(value % LIMB)
+            carry = value // LIMB
+            position += 1
+        while carry:
+            if position < len(limbs):
+                carry += limbs[position]
+                limbs[position] = carry % LIMB
+            else:
+                limbs.append(carry % LIMB)
+            carry //= LIMB
+            position += 1
+        # A selection may start with zeros; keep the top limb non-zero so __str__ stays canonical.
+        while limbs and not limbs[-1]:
+            limbs.pop()
+
+    def __str__(self) -> str:
+        if not self.limbs:
+            return "0"
+        return str(self.limbs[-1]) + "".join(f"{limb:09d}" for limb in reversed(self.limbs[:-1]))
+
+    def __int__(self) -> int:
+        return sum(limb * LIMB**power for power, limb in enumerate(self.limbs))
+
+
+class BankStream:
+    """Day 03 state that can be fed arbitrary byte chunks of a bank file."""
+
+    def __init__(self, ks: Iterable[int] = KS, on_row: Callable[[int, list[bytes]], None] | None = None) -> None:
+        self.selectors = [BankSelector(k) for k in ks]
+        self.sums = [DecimalSum() for _ in self.selectors]
+        self.rows = 0
+        self._on_row = on_row
+        self._open = False
+
+    def feed(self, chunk: bytes) -> None:
+        pieces = chunk.replace(b"\r", b"").split(b"\n")
+        for index, piece in enumerate(pieces):
+            if index:
+                self._end_row()
+            if piece:
+                if not piece.isdigit():
+                    raise ValueError(f"non-digit byte in bank {self.rows + 1}")
+                for selector in self.selectors:
+                    selector.feed(piece)
+                self._open = True
+
+    def close(self) -> list[DecimalSum]:
+        """Finish a final unterminated bank and return the sum for each ``k``."""
+        self._end_row()
+        return self.sums
+
+    def _end_row(self) -> None:
+        if not self._open:
+            return
+        selections = [selector.finish() for selector in self.selectors]
+        for total, selected in zip(self.sums, selections):
+            total.add(selected)
+        self.rows += 1
+        self._open = False
+        if self._on_row:
+            self._on_row(self.rows, selections)
+
+
+def solve_stream(stream: BinaryIO, ks: Iterable[int] = KS, chunk_size: int = CHUNK_SIZE,
+                 on_row: Callable[[int, list[bytes]], None] | None = None) -> list[DecimalSum]:
+    """Solve a bank file from any binary stream (file, pipe, socket)."""
+    state = BankStream(ks, on_row)
+    while chunk := stream.read(chunk_size):
+        state.feed(chunk)
+    return state.close()
+
+
+def benchmark(length: int, chunk_size: int) -> None:
+    codex = load_solution("ai-solutions/03/gpt-5.1-codex/python/solution.py")
+    sys.set_int_max_str_digits(0)
+    row = "".join(random_banks(length // 100 or 1, 100))[:length]
+    data = row.encode() + b"\n"
+
+    print(f"one bank of {len(row):,} digits")
+    print(f"{'k':>10}{'codex (s)':>12}{'codex peak (KiB)':>18}{'stream (s)':>12}{'stream peak (KiB)':>19}")
+    for k in (12, len(row) // 100, len(row) // 2):
+        results = []
+        for run in (lambda: codex.max_subsequence_number(row, k),
+                    lambda: str(solve_stream(io.BytesIO(data), (k,), chunk_size)[0])):
+            started = time.perf_counter()
+            value = run()
+            elapsed = time.perf_counter() - started
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append((value, elapsed, peak))
+        (expected, codex_time, codex_peak), (actual, stream_time, stream_peak) = results
+        if str(expected) != actual:
+            raise AssertionError(f"k={k}: stream disagrees with max_subsequence_number")
+        print(f"{k:>10,}{codex_time:>12.3f}{codex_peak / 1024:>18,.0f}{stream_time:>12.3f}{stream_peak / 1024:>19,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default=str(input_path("03")), help="bank file, or - for stdin")
+    parser.add_argument("--ks", type=int, nargs="+", default=list(KS), help="digits to select")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--emit", action="store_true", help="write each bank's selections to stdout first")
+    parser.add_argument("--bench", type=int, metavar="DIGITS", help="time one long bank against max_subsequence_number")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.chunk_size)
+        return
+
+    def emit(row: int, selections: list[bytes]) -> None:
+        out = sys.stdout.buffer
+        out.write(b"%d\t" % row + b"\t".join(selections) + b"\n")
+
+    on_row = emit if args.emit else None
+    if args.input == "-":
+        sums = solve_stream(sys.stdin.buffer, args.ks, args.chunk_size, on_row)
+    else:
+        with Path(args.input).open("rb") as file:
+            sums = solve_stream(file, args.ks, args.chunk_size, on_row)
+
+    sys.stdout.flush()
+    for total in sums:
+        print(total)
+
+
+if __name__ == "__main__":
+    main()
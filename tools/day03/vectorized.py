@@ -0,0 +1,146 @@
+"""Batched NumPy Day 03 selection across all banks at once.
+
+The input is loaded into a 2D digit matrix with ``frombuffer`` (one row per
+bank, no per-character ``int()``); ragged banks are right-padded with ``-1`` so
+padding never wins. The greedy then runs for every bank at the same time: for
+each output digit, the columns outside each row's window
+``[start, length - remaining)`` are masked to ``-1`` and one ``argmax`` per
+row picks the leftmost maximum.
+
+    python -m tools.day03.vectorized [input] [--ks 2 12]
+    python -m tools.day03.vectorized --bench 100000 [--ragged]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from tools.common import input_path, load_solution
+from tools.day03.joltage import KS, getBiggestLeftToRight, random_banks
+
+ZERO = ord("0")
+NEWLINE = ord("\n")
+PAD = -1
+
+
+def load_banks(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Return an int8 digit matrix (padded with ``PAD``) and the bank lengths."""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if not buf.size:
+        return np.empty((0, 0), dtype=np.int8), np.empty(0, dtype=np.int64)
+    ends = np.flatnonzero(buf == NEWLINE)
+    if buf[-1] != NEWLINE:
+        ends = np.append(ends, buf.size)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts
+    has_cr = lengths > 0
+    has_cr[has_cr] = buf[ends[has_cr] - 1] == ord("\r")
+    lengths -= has_cr
+    keep = lengths > 0
+    starts, lengths = starts[keep], lengths[keep]
+
+    width = int(lengths.max(initial=0))
+    if lengths.size and (lengths == width).all() and not has_cr.any() and keep.all():
+        # Equal rows sit a fixed stride apart, so a reshape replaces the scatter below.
+        stride = width + 1
+        body = buf[: lengths.size * stride] if buf.size >= lengths.size * stride else np.append(buf, NEWLINE)
+        matrix = body.reshape(lengths.size, stride)[:, :width].astype(np.int8) - ZERO
+    else:
+        matrix = np.full((lengths.size, width), PAD, dtype=np.int8)
+        rows = np.repeat(np.arange(lengths.size), lengths)
+        columns = np.arange(rows.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        matrix[rows, columns] = buf[np.repeat(starts, lengths) + columns].astype(np.int8) - ZERO
+
+    bad = (matrix > 9) | ((matrix < 0) & (np.arange(width) < lengths[:, None]))
+    if bad.any():
+        row, column = np.argwhere(bad)[0]
+        raise ValueError(f"non-digit byte at byte {starts[row] + column}")
+    return matrix, lengths
+
+
+def select(matrix: np.ndarray, lengths: np.ndarray, k: int) -> np.ndarray:
+    """Digits of the best ``k``-digit joltage of every bank, as a ``(banks, k)`` array."""
+    if lengths.size and lengths.min() < k:
+        raise ValueError(f"bank {int(np.argmin(lengths))} has fewer than {k} digits")
+    banks = matrix.shape[0]
+    picked = np.empty((banks, k), dtype=np.int8)
+    if not banks:
+        return picked
+    start = np.zeros(banks, dtype=np.int64)
+    rows = np.arange(banks)
+    for pos in range(k):
+        stop = lengths - (k - pos - 1)
+        low, high = int(start.min(initial=0)), int(stop.max(initial=0))
+        columns = np.arange(low, high)
+        window = matrix[:, low:high]
+        outside = (columns < start[:, None]) | (columns >= stop[:, None])
+        index = np.where(outside, PAD, window).argmax(axis=1) + low
+        picked[:, pos] = matrix[rows, index]
+        start = index + 1
+    return picked
+
+
+def total(picked: np.ndarray) -> int:
+    """Sum over the banks of the numbers spelled by each row of ``picked``."""
+    column_sums = picked.sum(axis=0, dtype=np.int64).tolist()
+    return sum(value * 10**power for power, value in enumerate(reversed(column_sums)))
+
+
+def solve(data: bytes, ks: Iterable[int] = KS) -> list[int]:
+    """Sum of the best ``k``-digit joltage over all banks, for each ``k``."""
+    matrix, lengths = load_banks(data)
+    return [total(select(matrix, lengths, k)) for k in ks]
+
+
+def benchmark(rows: int, ragged: bool) -> None:
+    if ragged:
+        rng = random.Random(2025)
+        banks = [bank[: rng.randint(50, 100)] for bank in random_banks(rows)]
+    else:
+        banks = random_banks(rows)
+    data = ("\n".join(banks) + "\n").encode()
+    gemini = load_solution("ai-solutions/03/gemini-3-pro/python/solution.py")
+
+    baselines = (
+        ("getBiggestLeftToRight", lambda: [sum(getBiggestLeftToRight(b, k) for b in banks) for k in KS]),
+        ("gemini-3-pro solve_line", lambda: [sum(gemini.solve_line(b, k) for b in banks) for k in KS]),
+    )
+    started = time.perf_counter()
+    actual = solve(data)
+    batched = time.perf_counter() - started
+
+    print(f"{rows:,} {'ragged' if ragged else 'equal'} banks, k = {', '.join(map(str, KS))}")
+    print(f"{'numpy batch':<26}{batched:>8.3f} s")
+    for name, run in baselines:
+        started = time.perf_counter()
+        expected = run()
+        elapsed = time.perf_counter() - started
+        if actual != expected:
+            raise AssertionError(f"batch {actual} != {name} {expected}")
+        print(f"{name:<26}{elapsed:>8.3f} s ({elapsed / batched:.1f}x slower)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", type=Path, default=input_path("03"))
+    parser.add_argument("--ks", type=int, nargs="+", default=list(KS), help="digits to select")
+    parser.add_argument("--bench", type=int, metavar="ROWS", help="time synthetic banks against the loops")
+    parser.add_argument("--ragged", action="store_true", help="bench with banks of 50-100 digits")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.ragged)
+        return
+
+    for value in solve(args.input.read_bytes(), args.ks):
+        print(value)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Day 05 (Cafeteria) fresh-ingredient tools."""
@@ -0,0 +1,189 @@
+"""Inclusive integer intervals shared by Day 02 (ID ranges) and Day 05 (fresh ranges).
+
+An `IntervalSet` holds sorted, disjoint, non-adjacent intervals as two int64
+NumPy arrays. Building one sorts and coalesces in a few vectorized passes, and
+complement, intersection, union and membership are all array operations.
+`parse_intervals` decodes ``a-b`` lists straight from bytes.
+
+    python -m tools.intervals --bench 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Iterable, Iterator
+
+import numpy as np
+
+MAX_DIGITS = 18
+ZERO, NINE, DASH = ord("0"), ord("9"), ord("-")
+
+
+def parse_intervals(data: bytes | memoryview | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Decode ``a-b`` entries separated by anything but digits and dashes.
+
+    Returns the starts and ends as int64 arrays, in input order.
+    """
+    buf = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    digit = (buf >= ZERO) & (buf <= NINE)
+    edges = np.flatnonzero(np.diff(digit.astype(np.int8), prepend=0, append=0))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+
+    if run_starts.size % 2:
+        raise ValueError(f"unpaired bound at byte {run_starts[-1]}")
+    lengths = run_ends - run_starts
+    if lengths.size and lengths.max() > MAX_DIGITS:
+        raise ValueError(f"bound longer than {MAX_DIGITS} digits at byte {run_starts[np.argmax(lengths > MAX_DIGITS)]}")
+    gaps = run_starts[1::2] - run_ends[0::2]
+    separators = buf[run_ends[0::2]]
+    bad = np.flatnonzero((gaps != 1) | (separators != DASH))
+    if bad.size:
+        raise ValueError(f"expected '-' at byte {run_ends[0::2][bad[0]]}")
+    # Between entries (and before the first / after the last) any byte but a dash may appear.
+    dashes = np.flatnonzero(buf == DASH)
+    outside_starts = np.concatenate(([0], run_ends[1::2]))
+    outside_ends = np.concatenate((run_starts[0::2], [buf.size]))
+    first_dash = np.searchsorted(dashes, outside_starts)
+    stray = np.flatnonzero(first_dash < np.searchsorted(dashes, outside_ends))
+    if stray.size:
+        raise ValueError(f"unexpected '-' at byte {dashes[first_dash[stray[0]]]}")
+
+    values = np.zeros(run_starts.size, dtype=np.int64)
+    weight = 1
+    for column in range(int(lengths.max(initial=0))):
+        present = lengths > column
+        digits = buf[np.where(present, run_ends - 1 - column, run_starts)].astype(np.int64) - ZERO
+        values += np.where(present, digits, 0) * weight
+        weight *= 10
+    return values[0::2], values[1::2]
+
+
+class IntervalSet:
+    """Sorted, disjoint, non-adjacent inclusive intervals."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        """Wrap arrays that are already coalesced; use `coalesce` otherwise."""
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def coalesce(cls, starts: np.ndarray, ends: np.ndarray) -> IntervalSet:
+        """Sort intervals and merge the overlapping or adjacent ones."""
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        keep = starts <= ends
+        starts, ends = starts[keep], ends[keep]
+        if not starts.size:
+            return cls(starts, ends)
+
+        order = np.argsort(starts)
+        starts, ends = starts[order], ends[order]
+        reach = np.maximum.accumulate(ends)
+        # A new interval begins wherever it starts past everything before it, plus one.
+        fresh = np.empty(starts.size, dtype=bool)
+        fresh[0] = True
+        fresh[1:] = starts[1:] > reach[:-1] + 1
+        heads = np.flatnonzero(fresh)
+        return cls(starts[heads], np.maximum.reduceat(ends, heads))
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> IntervalSet:
+        pairs = np.array(list(ranges), dtype=np.int64).reshape(-1, 2)
+        return cls.coalesce(pairs[:, 0], pairs[:, 1])
+
+    @classmethod
+    def parse(cls, data: bytes) -> IntervalSet:
+        return cls.coalesce(*parse_intervals(data))
+
+    def __len__(self) -> int:
+        return self.starts.size
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts.tolist(), self.ends.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends)
+
+    def __repr__(self) -> str:
+        shown = ", ".join(f"{start}-{end}" for start, end in list(self)[:5])
+        return f"IntervalSet([{shown}{', ...' if len(self) > 5 else ''}], n={len(self)})"
+
+    def size(self) -> int:
+        """Number of integers covered."""
+        return int((self.ends - self.starts + 1).sum(dtype=object))
+
+    def contains(self, values: np.ndarray) -> np.ndarray:
+        """Mask of the values that fall inside an interval."""
+        values = np.asarray(values, dtype=np.int64)
+        index = np.searchsorted(self.starts, values, side="right") - 1
+        inside = index >= 0
+        inside[inside] = values[inside] <= self.ends[index[inside]]
+        return inside
+
+    def complement(self, low: int, high: int) -> IntervalSet:
+        """The integers of ``low..high`` not covered by this set."""
+        starts = np.concatenate(([low], self.ends + 1))
+        ends = np.concatenate((self.starts - 1, [high]))
+        starts = np.maximum(starts, low)
+        ends = np.minimum(ends, high)
+        keep = starts <= ends
+        return IntervalSet(starts[keep], ends[keep])
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet.coalesce(
+            np.concatenate((self.starts, other.starts)),
+            np.concatenate((self.ends, other.ends)),
+        )
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        if not len(self) or not len(other):
+            return IntervalSet(self.starts[:0], self.ends[:0])
+        low = int(min(self.starts[0], other.starts[0]))
+        high = int(max(self.ends[-1], other.ends[-1]))
+        gaps = self.complement(low, high).union(other.complement(low, high))
+        return gaps.complement(low, high)
+
+
+def benchmark(count: int, seed: int = 2025) -> None:
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, 10**15, count, dtype=np.int64)
+    ends = starts + rng.integers(0, 10**9, count, dtype=np.int64)
+
+    started = time.perf_counter()
+    merged = IntervalSet.coalesce(starts, ends)
+    vectorized = time.perf_counter() - started
+    print(f"{count:,} intervals -> {len(merged):,} after coalescing")
+    print(f"IntervalSet.coalesce: {vectorized:.2f} s ({count / vectorized / 1e6:.1f} M intervals/s)")
+
+    sample = min(count, 1_000_000)
+    started = time.perf_counter()
+    _merge_loop(zip(starts[:sample].tolist(), ends[:sample].tolist()))
+    loop = (time.perf_counter() - started) * count / sample
+    print(f"sorted() + Python loop: {loop:.2f} s (extrapolated from {sample:,})")
+
+
+def _merge_loop(ranges: Iterable[tuple[int, int]]) -> list[list[int]]:
+    """The sort-and-merge loop of human-solutions/05, for comparison."""
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if not merged or start > merged[-1][1] + 1:
+            merged.append([start, end])
+        else:
+            merged[-1][1] = max(merged[-1][1], end)
+    return merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bench", type=int, metavar="COUNT", default=10_000_000, help="intervals to merge")
+    args = parser.parse_args()
+    benchmark(args.bench)
+
+
+if __name__ == "__main__":
+    main()